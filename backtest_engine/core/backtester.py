@@ -7,9 +7,11 @@ Simulates the execution of a trading strategy over historical data.
 @Date: 2025-06-19
 """
 
-from typing import List
+from typing import Callable, List
+import numpy as np
 import pandas as pd
 from backtest_engine.strategies.base_strategy import BaseStrategy
+from backtest_engine.core.checkpoint import BacktestCheckpoint
 from backtest_engine.core.trade import Trade
 from backtest_engine.core.portfolio import Portfolio
 
@@ -29,52 +31,159 @@ class Backtester:
         """
         self.strategy = strategy
         self.prices = strategy.prices
+        self.precision = strategy.precision
         self.portfolio = Portfolio(initial_cash)
         self.trade_log: List[Trade] = []
-        self.portfolio_value = []
+        self.resume_after = None  # last bar already covered by a checkpoint
+        self.last_date = None
+        self.last_signal = 0
+
+    @classmethod
+    def resume(
+        cls,
+        checkpoint: BacktestCheckpoint,
+        strategy_factory: Callable[[pd.DataFrame], BaseStrategy],
+        new_prices: pd.DataFrame,
+    ) -> "Backtester":
+        """
+        Create a backtester that continues a checkpointed run over new bars.
+
+        The strategy is built over the checkpoint's warm-up history plus the
+        new bars only, and `run` processes just the new bars, producing the
+        same values and trades a full rerun would produce for them.
+
+        Parameters:
+        - checkpoint (BacktestCheckpoint): State saved by `checkpoint()`
+        - strategy_factory (callable): Builds the strategy from a price DataFrame,
+          e.g. lambda p: MovingAverageCrossoverStrategy(p, 20, 50)
+        - new_prices (pd.DataFrame): Bars strictly after checkpoint.last_date
+
+        Returns:
+        - Backtester: Ready to `run` over the new bars
+        """
+        new_prices = new_prices[new_prices.index > checkpoint.last_date]
+        missing = set(checkpoint.history.columns) - set(new_prices.columns)
+        if missing:
+            raise ValueError(f"Missing required columns in new price data: {missing}")
+
+        prices = pd.concat([checkpoint.history, new_prices[list(checkpoint.history.columns)]])
+        backtester = cls(strategy_factory(prices))
+        backtester.portfolio.cash = checkpoint.cash
+        backtester.portfolio.position = checkpoint.position
+        backtester.portfolio.entry_price = checkpoint.entry_price
+        backtester.resume_after = checkpoint.last_date
+        backtester.last_date = checkpoint.last_date
+        backtester.last_signal = checkpoint.last_signal
+        return backtester
 
     def run(self) -> pd.DataFrame:
         """
         Run the backtest over the price data and strategy signals.
 
+        Only bars carrying a buy/sell event are visited; the equity curve is
+        then filled in for every bar with one vectorized pass.
+
         Returns:
         - pd.DataFrame: Portfolio value and trades indexed by date
+          (int64 epoch ns under an epoch-indexed precision policy)
         """
-        signals = self.strategy.generate_signals()
+        events = self.strategy.generate_events()
+        index = events.index
+        start = 0
+        if self.resume_after is not None:
+            start = int(index.searchsorted(self.resume_after, side="right"))
 
-        for date, signal in signals.items():
-            close_price = self.prices.loc[date, "Close"]
+        closes = self.prices["Close"].to_numpy().astype(float)
+        if not index.equals(self.prices.index):
+            rows = self.prices.index.get_indexer(index)
+            if (rows < 0).any():
+                raise KeyError(f"Signal dates not in price data: {list(index[rows < 0][:3])}")
+            closes = closes[rows]
 
-            if signal == 1:
+        # Portfolio state after each trade, starting with the state on entry
+        state_positions = [start - 1]
+        state_cash = [self.portfolio.cash]
+        state_shares = [self.portfolio.position]
+
+        first = int(np.searchsorted(events.positions, start))
+        for pos, action in zip(events.positions[first:].tolist(), events.actions[first:].tolist()):
+            close_price = closes[pos]
+
+            if action == 1:
                 if self.portfolio.position == 0:
                     self.portfolio.buy(close_price)
                     self.trade_log.append(Trade(
-                        date=date,
+                        date=index[pos],
                         type="BUY",
                         price=close_price,
                         shares=self.portfolio.position
                     ))
+                else:
+                    continue
 
-            elif signal == -1:
+            elif action == -1:
                 if self.portfolio.position > 0:
                     pnl = self.portfolio.sell(close_price)
                     self.trade_log.append(Trade(
-                        date=date,
+                        date=index[pos],
                         type="SELL",
                         price=close_price,
                         shares=0.0,  # After sell, no position held
                         pnl=pnl
                     ))
+                else:
+                    continue
+
+            state_positions.append(pos)
+            state_cash.append(self.portfolio.cash)
+            state_shares.append(self.portfolio.position)
+
+        # Forward-fill cash and shares from the latest trade at or before each bar
+        bars = np.arange(start, len(index))
+        latest = np.searchsorted(np.asarray(state_positions), bars, side="right") - 1
+        cash = np.asarray(state_cash, dtype=float)[latest]
+        shares = np.asarray(state_shares, dtype=float)[latest]
+        values = cash + shares * closes[start:]
+
+        if len(bars):
+            self.last_date = index[-1]
+            last_event = events.positions[-1] if len(events) else -1
+            self.last_signal = int(events.actions[-1]) if last_event == len(index) - 1 else 0
 
-            # Track value every day
-            self.portfolio_value.append((date, self.portfolio.value(close_price)))
+        return self._build_result_df(index[start:], values)
+
+    def checkpoint(self) -> BacktestCheckpoint:
+        """
+        Snapshot the engine state after `run` so a later run can resume from it.
+
+        Returns:
+        - BacktestCheckpoint: Portfolio state, last bar and warm-up price history
+        """
+        warmup = self.strategy.warmup
+        if warmup is None:
+            raise ValueError(
+                f"{type(self.strategy).__name__} does not declare a warmup, so it cannot be resumed."
+            )
+        if self.last_date is None:
+            raise ValueError("Nothing to checkpoint; call run() first.")
 
-        return self._build_result_df()
+        history = self.prices.loc[:self.last_date]
+        return BacktestCheckpoint(
+            cash=self.portfolio.cash,
+            position=self.portfolio.position,
+            entry_price=self.portfolio.entry_price,
+            last_date=self.last_date,
+            last_signal=self.last_signal,
+            history=history.iloc[max(len(history) - warmup, 0):],
+        )
 
-    def _build_result_df(self) -> pd.DataFrame:
+    def _build_result_df(self, index: pd.Index, values: np.ndarray) -> pd.DataFrame:
         """
         Build the final portfolio value DataFrame.
         """
-        df = pd.DataFrame(self.portfolio_value, columns=["date", "portfolio_value"])
-        df.set_index("date", inplace=True)
+        df = pd.DataFrame(
+            {"portfolio_value": values.astype(self.precision.float_dtype)},
+            index=self.precision.result_index(index),
+        )
+        df.index.name = "date"
         return df
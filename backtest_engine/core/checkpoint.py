@@ -0,0 +1,119 @@
+"""
+@File: checkpoint.py
+
+Serializable snapshot of a finished backtest, used to resume it over new bars.
+
+A checkpoint holds the portfolio state, the last processed bar and signal,
+and the trailing price bars the strategy needs to warm up its indicators.
+Resuming from it only touches the appended data plus that warm-up window.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Optional
+import pandas as pd
+
+CHECKPOINT_VERSION = 1
+
+
+@dataclass
+class BacktestCheckpoint:
+    """
+    Engine state at the end of a backtest run.
+
+    Attributes:
+    - cash (float): Portfolio cash
+    - position (float): Number of shares held
+    - entry_price (float, optional): Entry price of the open position
+    - last_date (pd.Timestamp): Last bar processed
+    - last_signal (int): Signal emitted on the last bar
+    - history (pd.DataFrame): Trailing price bars used to warm up indicators
+    """
+    cash: float
+    position: float
+    entry_price: Optional[float]
+    last_date: pd.Timestamp
+    last_signal: int
+    history: pd.DataFrame
+
+    def to_dict(self) -> dict:
+        """
+        Convert the checkpoint to a JSON-compatible dict without losing precision.
+        """
+        is_datetime = isinstance(self.history.index, pd.DatetimeIndex)
+        tz = self.history.index.tz if is_datetime else None
+        return {
+            "version": CHECKPOINT_VERSION,
+            "cash": float(self.cash),
+            "position": float(self.position),
+            "entry_price": None if self.entry_price is None else float(self.entry_price),
+            "last_date": _encode_label(self.last_date),
+            "last_signal": int(self.last_signal),
+            "history": {
+                "datetime_index": is_datetime,
+                "tz": None if tz is None else str(tz),
+                "index": [_encode_label(label) for label in self.history.index],
+                "columns": {col: self.history[col].tolist() for col in self.history.columns},
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BacktestCheckpoint":
+        """
+        Rebuild a checkpoint from the output of `to_dict`.
+        """
+        if data.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {data.get('version')}")
+
+        history = data["history"]
+        if history["datetime_index"]:
+            # ISO strings carry fixed UTC offsets; go through UTC so histories
+            # spanning a DST change parse, then restore the named timezone
+            tz = history.get("tz")
+            if tz is None:
+                index = pd.DatetimeIndex(pd.to_datetime(history["index"]))
+                last_date = pd.Timestamp(data["last_date"])
+            else:
+                index = pd.DatetimeIndex(pd.to_datetime(history["index"], utc=True)).tz_convert(tz)
+                last_date = pd.Timestamp(data["last_date"]).tz_convert(tz)
+        else:
+            index = pd.Index(history["index"])
+            last_date = data["last_date"]
+
+        return cls(
+            cash=data["cash"],
+            position=data["position"],
+            entry_price=data["entry_price"],
+            last_date=last_date,
+            last_signal=data["last_signal"],
+            history=pd.DataFrame(history["columns"], index=index),
+        )
+
+    def save(self, path: str) -> None:
+        """
+        Write the checkpoint to a JSON file.
+        """
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> "BacktestCheckpoint":
+        """
+        Read a checkpoint previously written with `save`.
+        """
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+def _encode_label(label):
+    """
+    Encode an index label for JSON, keeping timestamps as ISO strings.
+    """
+    if isinstance(label, pd.Timestamp):
+        return label.isoformat()
+    if hasattr(label, "item"):
+        return label.item()
+    return label
@@ -0,0 +1,138 @@
+"""
+@File: chunked.py
+
+Out-of-core backtesting over price histories too large to load at once.
+
+Prices are consumed as time-ordered chunks. Each chunk is run as a
+resumed backtest: the strategy sees only the checkpoint's warm-up bars
+plus the chunk, and cash, shares and the last signal carry over through
+the checkpoint. Equity and trades are appended to CSV files as each chunk
+finishes, so peak memory depends on the chunk size and the strategy's
+warm-up, not on the length of the history. Results match an in-memory
+run exactly, provided the strategy's indicators depend only on its
+declared warm-up window (as the built-in and expression strategies do).
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import csv
+import os
+from dataclasses import asdict, fields
+from typing import Callable, Iterable, Iterator, Optional
+import pandas as pd
+from backtest_engine.core.backtester import Backtester
+from backtest_engine.core.checkpoint import BacktestCheckpoint
+from backtest_engine.core.trade import Trade
+from backtest_engine.strategies.base_strategy import BaseStrategy
+
+
+def read_csv_chunks(path: str, chunksize: int = 100_000, index_col: int = 0) -> Iterator[pd.DataFrame]:
+    """
+    Stream a date-indexed price CSV in chunks of rows.
+
+    Parameters:
+    - path (str): CSV with a date column and OHLCV columns, oldest bar first
+    - chunksize (int): Rows per chunk
+    - index_col (int): Position of the date column
+
+    Returns:
+    - iterator: DataFrames indexed by date
+    """
+    with pd.read_csv(path, index_col=index_col, parse_dates=True, chunksize=chunksize,
+                     float_precision="round_trip") as reader:
+        yield from reader
+
+
+class ChunkedBacktester:
+    """
+    Runs a resumable strategy chunk by chunk, writing results incrementally.
+    """
+
+    def __init__(
+        self,
+        strategy_factory: Callable[[pd.DataFrame], BaseStrategy],
+        initial_cash: float = 10000.0,
+    ) -> None:
+        """
+        Parameters:
+        - strategy_factory (callable): Builds the strategy from a price DataFrame,
+          e.g. lambda p: MovingAverageCrossoverStrategy(p, 20, 50); the strategy
+          must declare a `warmup`
+        - initial_cash (float): Starting portfolio value in cash
+        """
+        self.strategy_factory = strategy_factory
+        self.initial_cash = initial_cash
+        self.bars_processed = 0
+        self.trade_count = 0
+
+    def run(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        equity_path: Optional[str] = None,
+        trades_path: Optional[str] = None,
+    ) -> BacktestCheckpoint:
+        """
+        Backtest over all chunks in order.
+
+        Parameters:
+        - chunks (iterable): Price DataFrames in strictly increasing time order
+        - equity_path (str, optional): CSV file receiving the portfolio value per bar
+        - trades_path (str, optional): CSV file receiving the executed trades
+
+        Returns:
+        - BacktestCheckpoint: Final state, usable to resume with further data
+        """
+        for path in (equity_path, trades_path):
+            if path is not None and os.path.exists(path):
+                os.remove(path)
+        if trades_path is not None:
+            with open(trades_path, "w", newline="") as f:
+                csv.writer(f).writerow([field.name for field in fields(Trade)])
+
+        self.bars_processed = 0
+        self.trade_count = 0
+        checkpoint = None
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+            if not chunk.index.is_monotonic_increasing:
+                raise ValueError("Price chunks must be sorted by time.")
+            if checkpoint is not None and chunk.index[0] <= checkpoint.last_date:
+                raise ValueError(
+                    f"Chunk starting {chunk.index[0]} overlaps bars up to {checkpoint.last_date}."
+                )
+
+            if checkpoint is None:
+                backtester = Backtester(self.strategy_factory(chunk), self.initial_cash)
+                if backtester.strategy.warmup is None:
+                    raise ValueError(
+                        f"{type(backtester.strategy).__name__} does not declare a warmup, "
+                        "so it cannot run in chunks."
+                    )
+            else:
+                backtester = Backtester.resume(checkpoint, self.strategy_factory, chunk)
+
+            result = backtester.run()
+            self._write(result, backtester.trade_log, equity_path, trades_path)
+            self.bars_processed += len(result)
+            self.trade_count += len(backtester.trade_log)
+            checkpoint = backtester.checkpoint()
+
+        if checkpoint is None:
+            raise ValueError("No price data to backtest.")
+        return checkpoint
+
+    @staticmethod
+    def _write(result: pd.DataFrame, trades: list, equity_path: Optional[str], trades_path: Optional[str]) -> None:
+        """
+        Append one chunk's equity rows and trades to the output files.
+        """
+        if equity_path is not None:
+            write_header = not os.path.exists(equity_path)
+            result.to_csv(equity_path, mode="a", header=write_header)
+        if trades_path is not None and trades:
+            with open(trades_path, "a", newline="") as f:
+                writer = csv.writer(f)
+                for trade in trades:
+                    writer.writerow(asdict(trade).values())
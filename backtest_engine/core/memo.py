@@ -0,0 +1,280 @@
+"""
+@File: memo.py
+
+Content-addressed memoization of whole backtest results.
+
+A backtest is identified by a SHA-256 hash of its price arrays, the
+strategy's class (including its source code) and parameters, the
+starting cash, the precision policy and the engine version. Results are
+kept in a size-bounded directory of pickles, evicted least recently used
+first. Any change to an input changes the hash, so stale results are
+never returned; inputs that cannot be fingerprinted bypass the cache.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+import warnings
+from typing import Optional
+import numpy as np
+import pandas as pd
+from backtest_engine.core.backtester import Backtester
+from backtest_engine.core.precision import PrecisionPolicy
+from backtest_engine.strategies.base_strategy import BaseStrategy
+from backtest_engine.strategies.expressions import Expr
+
+# Bump whenever a change to the engine can alter backtest results
+ENGINE_VERSION = "0.1-1"
+
+# Strategy attributes hashed separately from the parameters. Together with
+# each strategy's declared `derived_attrs`, everything else, private
+# attributes included, is part of the hash.
+_NON_PARAMETER_ATTRS = {"prices", "precision"}
+
+
+class UnhashableInputError(TypeError):
+    """
+    Raised when a backtest input cannot be fingerprinted reliably.
+    """
+
+
+def content_hash(strategy: BaseStrategy, initial_cash: float) -> str:
+    """
+    Stable hash identifying a backtest by content.
+
+    Parameters:
+    - strategy (BaseStrategy): Strategy with its price data
+    - initial_cash (float): Starting portfolio value in cash
+
+    Returns:
+    - str: Hex SHA-256 digest
+    """
+    h = hashlib.sha256()
+    _update(h, ENGINE_VERSION)
+    _update(h, _strategy_identity(type(strategy)))
+    _update(h, strategy.precision)
+    _update(h, float(initial_cash))
+    skipped = _NON_PARAMETER_ATTRS | _derived_attrs(type(strategy))
+    params = {
+        name: value for name, value in vars(strategy).items()
+        if name not in skipped
+    }
+    _update(h, params)
+    _update(h, strategy.prices)
+    return h.hexdigest()
+
+
+def _derived_attrs(cls: type) -> set:
+    """
+    Derived-state attributes declared by every class in the strategy's hierarchy.
+    """
+    return {name for klass in cls.__mro__ for name in vars(klass).get("derived_attrs", ())}
+
+
+def _strategy_identity(cls: type) -> list:
+    """
+    Qualified name and source of every class in the strategy's hierarchy.
+    """
+    identity = []
+    for klass in cls.__mro__:
+        if klass.__module__ in ("builtins", "abc"):
+            continue
+        try:
+            source = inspect.getsource(klass)
+        except (OSError, TypeError):
+            source = ""
+        identity.append(f"{klass.__module__}.{klass.__qualname__}\n{source}")
+    return identity
+
+
+def _update(h, value) -> None:
+    """
+    Feed a value into the hash with a type tag, recursing into containers.
+    """
+    if value is None or isinstance(value, (bool, int, float, str, np.generic)):
+        h.update(f"{type(value).__name__}:{value!r};".encode())
+    elif isinstance(value, (list, tuple)):
+        h.update(f"{type(value).__name__}[{len(value)}];".encode())
+        for item in value:
+            _update(h, item)
+    elif isinstance(value, dict):
+        h.update(f"dict[{len(value)}];".encode())
+        for key in sorted(value, key=repr):
+            _update(h, key)
+            _update(h, value[key])
+    elif isinstance(value, np.ndarray):
+        if value.dtype == object:
+            raise UnhashableInputError("Cannot fingerprint object arrays.")
+        h.update(f"ndarray:{value.dtype.str}:{value.shape};".encode())
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, pd.Index):
+        if isinstance(value, pd.DatetimeIndex):
+            h.update(f"DatetimeIndex:{value.tz};".encode())
+            _update(h, value.values.astype("datetime64[ns]").view(np.int64))
+        else:
+            _update(h, value.to_numpy())
+    elif isinstance(value, pd.DataFrame):
+        h.update(b"DataFrame;")
+        _update(h, value.index)
+        _update(h, [str(col) for col in value.columns])
+        for col in value.columns:
+            _update(h, value[col].to_numpy())
+    elif isinstance(value, pd.Series):
+        h.update(b"Series;")
+        _update(h, value.index)
+        _update(h, value.to_numpy())
+    elif isinstance(value, Expr):
+        _update(h, repr(value.key))
+    elif isinstance(value, PrecisionPolicy):
+        _update(h, repr(value))
+    else:
+        raise UnhashableInputError(f"Cannot fingerprint {type(value).__name__} values.")
+
+
+class ResultCache:
+    """
+    Size-bounded local store of pickled backtest results keyed by content hash.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 256 * 1024 ** 2) -> None:
+        """
+        Parameters:
+        - directory (str, optional): Where results are stored; defaults to
+          ~/.cache/backtest_engine/results
+        - max_bytes (int): Total size after which the least recently used
+          results are evicted
+        """
+        if directory is None:
+            directory = os.path.join(os.path.expanduser("~"), ".cache", "backtest_engine", "results")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key: str):
+        """
+        Return the stored value for `key`, or None if absent or unreadable.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            os.utime(path)  # mark as recently used
+        except Exception:
+            # Missing, evicted by another process, truncated, or pickled
+            # from classes that have since moved: all count as a miss
+            return None
+        return value
+
+    def put(self, key: str, value) -> None:
+        """
+        Store `value` under `key`, then evict old entries beyond `max_bytes`.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".pkl"):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    continue  # evicted by another process meanwhile
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+class CachedBacktester(Backtester):
+    """
+    Backtester that returns memoized results for identical inputs.
+
+    After `run`, `cache_hit` tells whether the result came from the cache;
+    the trade log and final portfolio state are restored either way.
+    """
+
+    def __init__(self, strategy: BaseStrategy, initial_cash: float = 10000.0,
+                 cache: Optional[ResultCache] = None) -> None:
+        """
+        Parameters:
+        - strategy (BaseStrategy): The trading strategy to run
+        - initial_cash (float): Starting portfolio value in cash
+        - cache (ResultCache, optional): Result store; defaults to ResultCache()
+        """
+        super().__init__(strategy, initial_cash)
+        self.initial_cash = initial_cash
+        self.cache = cache if cache is not None else ResultCache()
+        self.cache_hit = False
+
+    def run(self) -> pd.DataFrame:
+        """
+        Run the backtest, or load its result if an identical run is cached.
+
+        Returns:
+        - pd.DataFrame: Portfolio value indexed by date
+        """
+        self.cache_hit = False
+        key = self._cache_key()
+        if key is None:
+            return super().run()
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.cache_hit = True
+            self.trade_log = cached["trade_log"]
+            self.portfolio.cash = cached["cash"]
+            self.portfolio.position = cached["position"]
+            self.portfolio.entry_price = cached["entry_price"]
+            self.last_date = cached["last_date"]
+            self.last_signal = cached["last_signal"]
+            return cached["result"]
+
+        result = super().run()
+        try:
+            self.cache.put(key, {
+                "result": result,
+                "trade_log": self.trade_log,
+                "cash": self.portfolio.cash,
+                "position": self.portfolio.position,
+                "entry_price": self.portfolio.entry_price,
+                "last_date": self.last_date,
+                "last_signal": self.last_signal,
+            })
+        except Exception as e:
+            # The result is valid either way; only memoizing it failed
+            warnings.warn(f"Could not cache backtest result: {e!r}", RuntimeWarning, stacklevel=2)
+        return result
+
+    def _cache_key(self) -> Optional[str]:
+        """
+        Content hash for this run, or None when the run must bypass the cache.
+        """
+        # Resumed runs depend on restored portfolio state, not just inputs
+        if self.resume_after is not None:
+            return None
+        try:
+            return content_hash(self.strategy, self.initial_cash)
+        except UnhashableInputError:
+            return None
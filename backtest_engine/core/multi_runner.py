@@ -0,0 +1,202 @@
+"""
+@File: multi_runner.py
+
+Runs many strategies over the same price data in a single shared pass.
+
+Prices are validated and copied once, then shared by every strategy
+that opts in (see BaseStrategy.shares_prices) and whose precision
+matches the runner's. Strategies that can describe
+themselves as signal expressions have all their indicators compiled into
+one plan, so an indicator used by several strategies is computed once.
+All portfolios are then advanced together over a (bars x strategies)
+state matrix.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+from typing import Callable, Dict, List, MutableMapping, Optional
+import numpy as np
+import pandas as pd
+from backtest_engine.core.precision import DOUBLE, PrecisionPolicy
+from backtest_engine.core.trade import Trade
+from backtest_engine.strategies.base_strategy import BaseStrategy, shared_prices
+from backtest_engine.strategies.expression_strategy import combine_signals
+from backtest_engine.strategies.expressions import compile_expressions
+
+
+class MultiStrategyRunner:
+    """
+    Backtests several single-asset strategies on one price series at once.
+
+    Each strategy follows the same rules as Backtester: full allocation
+    buys when flat, full liquidation sells when long, starting from
+    `initial_cash`.
+    """
+
+    def __init__(
+        self,
+        prices: pd.DataFrame,
+        strategies: Dict[str, Callable[[pd.DataFrame], BaseStrategy]],
+        initial_cash: float = 10000.0,
+        precision: PrecisionPolicy = DOUBLE,
+        indicator_cache: Optional[MutableMapping] = None,
+    ) -> None:
+        """
+        Initialize the runner.
+
+        Parameters:
+        - prices (pd.DataFrame): OHLCV price data with 'Close' column
+        - strategies (dict): Name -> factory building a strategy from prices,
+          e.g. {"mac": lambda p: MovingAverageCrossoverStrategy(p, 20, 50)}
+        - initial_cash (float): Starting cash for every strategy
+        - precision (PrecisionPolicy): Dtypes for prices, indicators and signals
+        - indicator_cache (MutableMapping, optional): Indicator arrays kept across
+          runs over these same prices (see CompiledExpressions.evaluate)
+        """
+        if "Close" not in prices.columns:
+            raise ValueError("Missing required columns in price data: {'Close'}")
+        if not strategies:
+            raise ValueError("At least one strategy is required.")
+
+        self.precision = precision
+        self.prices = precision.cast_prices(prices)
+        self.initial_cash = initial_cash
+        self.indicator_cache = indicator_cache
+        self.names = list(strategies)
+        # Opted-in strategies at this precision read the runner's frame rather than each copying it
+        with shared_prices(self.prices, precision):
+            self.strategies = {name: factory(self.prices) for name, factory in strategies.items()}
+        self.trade_logs: Dict[str, List[Trade]] = {name: [] for name in self.names}
+
+    def generate_signals(self) -> pd.DataFrame:
+        """
+        Compute every strategy's signals, sharing indicator work where possible.
+
+        Returns:
+        - pd.DataFrame: Signals (1, 0, -1), one column per strategy
+        """
+        index = self.prices.index
+        signals = np.zeros((len(index), len(self.names)), dtype=self.precision.signal_dtype)
+
+        shared = {}
+        for k, name in enumerate(self.names):
+            strategy = self.strategies[name]
+            expressions = _expression_form(strategy)
+            if expressions is not None:
+                shared[k] = expressions
+                continue
+            events = strategy.generate_events()
+            positions = events.positions
+            if not events.index.equals(index):
+                dates = events.index[positions]
+                positions = index.get_indexer(dates)
+                if (positions < 0).any():
+                    raise KeyError(f"Signal dates not in price data: {list(dates[positions < 0][:3])}")
+            signals[positions, k] = events.actions
+
+        if shared:
+            roots = [e for buy, sell in shared.values() for e in (buy, sell) if e is not None]
+            program = compile_expressions(*roots)
+            values = iter(program.evaluate(
+                self.prices, dtype=self.precision.float_dtype, cache=self.indicator_cache
+            ))
+            for k, (buy, sell) in shared.items():
+                buy_mask = next(values)
+                sell_mask = next(values) if sell is not None else None
+                signals[:, k] = combine_signals(buy_mask, sell_mask, self.precision.signal_dtype)
+
+        return pd.DataFrame(signals, index=index, columns=self.names)
+
+    def run(self) -> pd.DataFrame:
+        """
+        Run all strategies together and build their equity curves.
+
+        Returns:
+        - pd.DataFrame: Portfolio value per strategy (one column each), indexed
+          like Backtester results; trades are recorded in `trade_logs`
+        """
+        signals = self.generate_signals().to_numpy()
+        index = self.prices.index
+        closes = self.prices["Close"].to_numpy().astype(float)
+        n_bars, n_strategies = signals.shape
+
+        cash = np.full(n_strategies, float(self.initial_cash))
+        shares = np.zeros(n_strategies)
+        entry = np.full(n_strategies, np.nan)
+        for log in self.trade_logs.values():
+            log.clear()
+
+        # State rows are snapshots taken after any bar where a trade happened
+        state_bars = [-1]
+        state_cash = [cash.copy()]
+        state_shares = [shares.copy()]
+
+        for t in np.flatnonzero(signals.any(axis=1)):
+            price = closes[t]
+            buys = (signals[t] == 1) & (shares == 0)
+            sells = (signals[t] == -1) & (shares > 0)
+            if not (buys.any() or sells.any()):
+                continue
+
+            pnl = (price - entry[sells]) * shares[sells]
+            cash[sells] = shares[sells] * price
+            shares[sells] = 0.0
+            entry[sells] = np.nan
+
+            shares[buys] = cash[buys] / price
+            entry[buys] = price
+            cash[buys] = 0.0
+
+            for k in np.flatnonzero(buys):
+                self.trade_logs[self.names[k]].append(Trade(
+                    date=index[t], type="BUY", price=price, shares=shares[k]
+                ))
+            for k, k_pnl in zip(np.flatnonzero(sells), pnl):
+                self.trade_logs[self.names[k]].append(Trade(
+                    date=index[t], type="SELL", price=price, shares=0.0, pnl=k_pnl
+                ))
+
+            state_bars.append(t)
+            state_cash.append(cash.copy())
+            state_shares.append(shares.copy())
+
+        latest = np.searchsorted(np.asarray(state_bars), np.arange(n_bars), side="right") - 1
+        values = np.asarray(state_cash)[latest] + np.asarray(state_shares)[latest] * closes[:, None]
+
+        result = pd.DataFrame(
+            values.astype(self.precision.float_dtype),
+            index=self.precision.result_index(index),
+            columns=self.names,
+        )
+        result.index.name = "date"
+        return result
+
+
+def _expression_form(strategy: BaseStrategy) -> Optional[tuple]:
+    """
+    The strategy's signal expressions, if they still describe its signals.
+
+    Expressions inherited from a class whose `generate_signals` or
+    `generate_events` a subclass overrides may no longer match what the
+    strategy actually trades, so those strategies run on their own.
+
+    Parameters:
+    - strategy (BaseStrategy): Strategy built over the runner's prices
+
+    Returns:
+    - tuple or None: (buy, sell) expressions, or None to use its events
+    """
+    cls = type(strategy)
+    owner = _defining_class(cls, "signal_expressions")
+    for method in ("generate_signals", "generate_events"):
+        if not issubclass(owner, _defining_class(cls, method)):
+            return None
+    return strategy.signal_expressions()
+
+
+def _defining_class(cls: type, name: str) -> type:
+    """
+    First class in the MRO of `cls` that defines attribute `name`.
+    """
+    return next(klass for klass in cls.__mro__ if name in vars(klass))
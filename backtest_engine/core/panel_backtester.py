@@ -0,0 +1,73 @@
+"""
+@File: panel_backtester.py
+
+Simulates a panel strategy's target weights over a price panel.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import numpy as np
+import pandas as pd
+from backtest_engine.strategies.panel_strategy import PanelStrategy
+
+
+class PanelBacktester:
+    """
+    Backtesting engine for cross-sectional (multi-symbol) strategies.
+
+    Weights chosen at a date's close earn the next date's returns. A missing
+    bar carries the last valid close forward, so a position held across a
+    gap earns the whole move when prices resume. The portfolio rebalances
+    to target weights every day.
+    """
+
+    def __init__(self, strategy: PanelStrategy, initial_cash: float = 10000.0) -> None:
+        """
+        Initialize the backtester.
+
+        Parameters:
+        - strategy (PanelStrategy): The panel strategy to run
+        - initial_cash (float): Starting portfolio value in cash
+        """
+        self.strategy = strategy
+        self.prices = strategy.prices
+        self.initial_cash = initial_cash
+        self.weights = None
+
+    def run(self) -> pd.DataFrame:
+        """
+        Run the backtest over the panel.
+
+        Returns:
+        - pd.DataFrame: Portfolio value and daily return indexed by date
+        """
+        weights_df = self.strategy.generate_weights()
+        self.weights = weights_df
+        weights = np.nan_to_num(weights_df.to_numpy(dtype=np.float64))
+        closes = _forward_fill(self.strategy.values.astype(np.float64))
+
+        returns = np.zeros_like(closes)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            returns[1:] = closes[1:] / closes[:-1] - 1
+        returns[~np.isfinite(returns)] = 0.0
+
+        portfolio_returns = np.zeros(len(closes))
+        portfolio_returns[1:] = np.einsum("ij,ij->i", weights[:-1], returns[1:])
+        equity = self.initial_cash * np.cumprod(1 + portfolio_returns)
+
+        df = pd.DataFrame({
+            "portfolio_value": equity.astype(self.strategy.precision.float_dtype),
+            "returns": portfolio_returns,
+        }, index=self.strategy.precision.result_index(self.prices.index))
+        df.index.name = "date"
+        return df
+
+
+def _forward_fill(values: np.ndarray) -> np.ndarray:
+    """
+    Carry each column's last non-NaN value down over NaN rows.
+    """
+    last_valid = np.where(~np.isnan(values), np.arange(len(values))[:, None], 0)
+    np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+    return np.take_along_axis(values, last_valid, axis=0)
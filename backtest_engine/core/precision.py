@@ -0,0 +1,94 @@
+"""
+@File: precision.py
+
+Engine-wide numeric precision policies.
+
+DOUBLE keeps the original behaviour: float64 prices, indicators and equity,
+int64 signals and a DatetimeIndex on results. COMPACT stores prices,
+indicators and equity as float32, signals as int8 and indexes backtest
+results by int64 epoch nanoseconds, roughly halving memory traffic.
+
+Accuracy of COMPACT relative to DOUBLE:
+- Prices are rounded to float32 (relative error <= 6e-8).
+- Moving averages and RSI stay within COMPACT_TOLERANCES["indicator_rtol"].
+- Cash, position and PnL are always accounted in float64, so equity and
+  metrics differ only through the rounded prices; see COMPACT_TOLERANCES.
+- A signal may flip where two indicators are equal to within the
+  indicator tolerance (e.g. an MA crossover that is a near-tie). Such
+  bars are rare on real data but are not guaranteed to match.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+
+NS_PER_DAY = 86_400 * 10**9
+
+COMPACT_TOLERANCES = {
+    "indicator_rtol": 1e-5,
+    "equity_rtol": 1e-5,
+    "metric_atol": 1e-4,
+}
+
+
+@dataclass(frozen=True)
+class PrecisionPolicy:
+    """
+    Dtypes used for prices, indicators, signals and result indexes.
+
+    Attributes:
+    - name (str): Policy name
+    - float_dtype (np.dtype): Dtype of prices, indicators and equity
+    - signal_dtype (np.dtype): Dtype of signal Series
+    - epoch_index (bool): Index results by int64 epoch ns instead of dates
+    """
+    name: str
+    float_dtype: np.dtype
+    signal_dtype: np.dtype
+    epoch_index: bool
+
+    def cast_prices(self, prices: pd.DataFrame) -> pd.DataFrame:
+        """
+        Return a copy of prices with price columns stored as `float_dtype`.
+
+        Volume is left untouched; DOUBLE leaves every column untouched.
+        """
+        prices = prices.copy()
+        if self.float_dtype == np.float64:
+            return prices
+        for col in prices.columns:
+            if col != "Volume" and pd.api.types.is_numeric_dtype(prices[col]):
+                prices[col] = prices[col].astype(self.float_dtype)
+        return prices
+
+    def cast_floats(self, values):
+        """
+        Cast an indicator Series or array to `float_dtype`.
+        """
+        if values.dtype == self.float_dtype:
+            return values
+        return values.astype(self.float_dtype)
+
+    def empty_signals(self, index: pd.Index) -> pd.Series:
+        """
+        All-hold signal Series in `signal_dtype`.
+        """
+        return pd.Series(np.zeros(len(index), dtype=self.signal_dtype), index=index)
+
+    def result_index(self, index: pd.Index) -> pd.Index:
+        """
+        Index for backtest results: epoch ns when `epoch_index`, else unchanged.
+        """
+        if not isinstance(index, pd.DatetimeIndex):
+            return index
+        if self.epoch_index:
+            epoch_ns = index.values.astype("datetime64[ns]").view(np.int64)
+            return pd.Index(epoch_ns, name=index.name)
+        return pd.DatetimeIndex(index, freq=None)
+
+
+DOUBLE = PrecisionPolicy("double", np.dtype(np.float64), np.dtype(np.int64), False)
+COMPACT = PrecisionPolicy("compact", np.dtype(np.float32), np.dtype(np.int8), True)
@@ -0,0 +1,57 @@
+"""
+@File: signals.py
+
+Sparse change-point representation of trading signals.
+
+Most bars of a typical strategy are holds. SparseSignals keeps only the
+bars where a buy or sell is emitted, so the backtester can visit those
+bars alone and fill in the equity curve between them in one vectorized step.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class SparseSignals:
+    """
+    Buy/sell events over a bar index.
+
+    Attributes:
+    - index (pd.Index): Bars the events refer to (the strategy's price index)
+    - positions (np.ndarray): Increasing integer bar positions of the events
+    - actions (np.ndarray): int8 action per event, 1 for buy and -1 for sell
+    """
+    index: pd.Index
+    positions: np.ndarray
+    actions: np.ndarray
+
+    def __post_init__(self) -> None:
+        self.positions = np.asarray(self.positions, dtype=np.int64)
+        self.actions = np.asarray(self.actions, dtype=np.int8)
+        if self.positions.shape != self.actions.shape:
+            raise ValueError("positions and actions must have the same length.")
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @classmethod
+    def from_dense(cls, signals: pd.Series) -> "SparseSignals":
+        """
+        Collapse a dense signal Series (1, 0, -1 per bar) to its non-hold bars.
+        """
+        values = signals.to_numpy()
+        positions = np.flatnonzero(values)
+        return cls(signals.index, positions, values[positions])
+
+    def to_dense(self, dtype=np.int64) -> pd.Series:
+        """
+        Expand to a dense signal Series aligned with `index`.
+        """
+        values = np.zeros(len(self.index), dtype=dtype)
+        values[self.positions] = self.actions
+        return pd.Series(values, index=self.index)
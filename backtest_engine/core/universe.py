@@ -0,0 +1,150 @@
+"""
+@File: universe.py
+
+Parallel single-asset backtests over a universe of symbols.
+
+Each worker process reads its symbols straight from a LocalDataStore,
+runs one strategy per symbol with the Backtester and sends back only the
+metrics, so the parent never handles price frames. Symbols are handed
+out in chunks to keep inter-process traffic low. A failing symbol is
+recorded with its error instead of stopping the run.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Type
+import pandas as pd
+from backtest_engine.core.backtester import Backtester
+from backtest_engine.data.store import LocalDataStore
+from backtest_engine.metrics.evaluator import calculate_metrics
+from backtest_engine.strategies.base_strategy import BaseStrategy
+
+
+@dataclass
+class UniverseResult:
+    """
+    Outcome of a universe run.
+
+    Attributes:
+    - table (pd.DataFrame): Metrics per symbol, best first
+    - failures (dict): Symbol -> error message for symbols that did not run
+    - elapsed (float): Wall-clock seconds for the run
+    """
+    table: pd.DataFrame
+    failures: Dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def symbols_per_second(self) -> float:
+        attempted = len(self.table) + len(self.failures)
+        return attempted / self.elapsed if self.elapsed > 0 else float("nan")
+
+    def summary(self) -> str:
+        """
+        One-line throughput report.
+        """
+        return (f"{len(self.table)} symbols ok, {len(self.failures)} failed "
+                f"in {self.elapsed:.2f}s ({self.symbols_per_second:.1f} symbols/s)")
+
+
+class UniverseRunner:
+    """
+    Run one strategy over many symbols in parallel and rank the results.
+    """
+
+    def __init__(
+        self,
+        store: LocalDataStore,
+        strategy_cls: Type[BaseStrategy],
+        params: Optional[dict] = None,
+        initial_cash: float = 10000.0,
+        max_workers: Optional[int] = None,
+        rank_by: str = "Sharpe Ratio",
+    ) -> None:
+        """
+        Parameters:
+        - store (LocalDataStore): Where workers read prices from
+        - strategy_cls (type): Strategy class, importable by worker processes
+        - params (dict, optional): Keyword arguments for the strategy
+        - initial_cash (float): Starting cash for every symbol
+        - max_workers (int, optional): Worker processes; defaults to the CPU
+          count, and 1 runs everything in this process
+        - rank_by (str): Metric to sort the table by, highest first
+        """
+        self.store = store
+        self.strategy_cls = strategy_cls
+        self.params = dict(params or {})
+        self.initial_cash = initial_cash
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.rank_by = rank_by
+
+    def run(self, symbols: Optional[List[str]] = None) -> UniverseResult:
+        """
+        Backtest every symbol and collect the metrics into one table.
+
+        Parameters:
+        - symbols (list, optional): Symbols to run; defaults to the whole store
+
+        Returns:
+        - UniverseResult: Ranked metrics table, failures and timing
+        """
+        if symbols is None:
+            symbols = self.store.symbols()
+        started = time.perf_counter()
+
+        chunks = _chunks(symbols, self.max_workers)
+        tasks = [(self.store.root, self.strategy_cls, self.params, self.initial_cash, chunk) for chunk in chunks]
+        if self.max_workers == 1 or len(tasks) <= 1:
+            outcomes = map(_run_chunk, tasks)
+            results = [row for chunk in outcomes for row in chunk]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                results = [row for chunk in pool.map(_run_chunk, tasks) for row in chunk]
+
+        rows, failures = {}, {}
+        for symbol, metrics, error in results:
+            if error is None:
+                rows[symbol] = metrics
+            else:
+                failures[symbol] = error
+
+        table = pd.DataFrame.from_dict(rows, orient="index")
+        if not table.empty:
+            table = table.sort_values(self.rank_by, ascending=False, na_position="last", kind="stable")
+        table.index.name = "symbol"
+        return UniverseResult(table, failures, time.perf_counter() - started)
+
+
+def _chunks(symbols: List[str], n_workers: int) -> List[List[str]]:
+    """
+    Split symbols into a few chunks per worker so stragglers even out.
+    """
+    if not symbols:
+        return []
+    size = max(1, len(symbols) // (4 * n_workers))
+    return [symbols[i:i + size] for i in range(0, len(symbols), size)]
+
+
+def _run_chunk(task: Tuple) -> List[Tuple[str, Optional[dict], Optional[str]]]:
+    """
+    Worker entry point: backtest each symbol of a chunk, isolating failures.
+    """
+    root, strategy_cls, params, initial_cash, symbols = task
+    store = LocalDataStore(root)
+    results = []
+    for symbol in symbols:
+        try:
+            strategy = strategy_cls(store.load(symbol), **params)
+            backtester = Backtester(strategy, initial_cash)
+            equity = backtester.run()["portfolio_value"]
+            metrics = calculate_metrics(equity)
+            metrics["Trades"] = len(backtester.trade_log)
+            results.append((symbol, metrics, None))
+        except Exception as exc:
+            results.append((symbol, None, f"{type(exc).__name__}: {exc}"))
+    return results
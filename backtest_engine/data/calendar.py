@@ -0,0 +1,168 @@
+"""
+@File: calendar.py
+
+Trading calendar mapping timestamps to dense integer bar positions.
+
+A TradingCalendar is built once from the sessions of one or more series.
+Every series is then aligned onto it up front, so downstream code can
+address bars by integer offset into contiguous arrays instead of joining
+on dates. Bars missing from a series, or present in a series but not on
+the calendar, are reported rather than silently dropped.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import warnings
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Mapping, Tuple, Union
+import numpy as np
+import pandas as pd
+
+
+class MissingBarsWarning(UserWarning):
+    """
+    Emitted when price data has gaps or bars that do not fit the calendar.
+    """
+
+
+@dataclass
+class AlignmentReport:
+    """
+    Bars that did not line up with the calendar, per series.
+
+    Attributes:
+    - missing (dict): Series name -> calendar sessions with no (or NaN) data
+    - extra (dict): Series name -> bars outside the calendar, left out of the alignment
+    """
+    missing: Dict[str, pd.DatetimeIndex] = field(default_factory=dict)
+    extra: Dict[str, pd.DatetimeIndex] = field(default_factory=dict)
+
+    @property
+    def is_clean(self) -> bool:
+        return not any(len(v) for v in self.missing.values()) and not any(len(v) for v in self.extra.values())
+
+    def summary(self) -> str:
+        """
+        One line per series with gaps or extra bars.
+        """
+        lines = []
+        for name in sorted(set(self.missing) | set(self.extra)):
+            missing = self.missing.get(name, pd.DatetimeIndex([]))
+            extra = self.extra.get(name, pd.DatetimeIndex([]))
+            if len(missing) or len(extra):
+                lines.append(f"{name}: {len(missing)} missing bars{_first_dates(missing)}, "
+                             f"{len(extra)} off-calendar bars{_first_dates(extra)}")
+        return "\n".join(lines)
+
+    def warn(self) -> None:
+        """
+        Emit a MissingBarsWarning with the summary if anything is misaligned.
+        """
+        if not self.is_clean:
+            warnings.warn(self.summary(), MissingBarsWarning, stacklevel=3)
+
+
+class TradingCalendar:
+    """
+    Sorted, unique trading sessions with O(log n) timestamp-to-position lookup.
+    """
+
+    def __init__(self, sessions: Iterable) -> None:
+        """
+        Parameters:
+        - sessions (iterable): Session timestamps; sorted and de-duplicated here
+        """
+        self.sessions = pd.DatetimeIndex(sessions).unique().sort_values().rename("date")
+
+    @classmethod
+    def from_frames(cls, frames: Union[Mapping[str, pd.DataFrame], Iterable[pd.DataFrame]]) -> "TradingCalendar":
+        """
+        Build a calendar from the union of the given frames' indexes.
+        """
+        if isinstance(frames, Mapping):
+            frames = frames.values()
+        index = pd.DatetimeIndex([])
+        for frame in frames:
+            index = index.union(pd.DatetimeIndex(frame.index))
+        return cls(index)
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def position(self, timestamp) -> int:
+        """
+        Integer bar position of a session; raises KeyError if it is not on the calendar.
+        """
+        pos = int(self.positions([timestamp])[0])
+        if pos < 0:
+            raise KeyError(f"{timestamp} is not a session on this calendar.")
+        return pos
+
+    def positions(self, index: Iterable) -> np.ndarray:
+        """
+        Integer bar positions for many timestamps, -1 where off-calendar.
+        """
+        return self.sessions.get_indexer(pd.DatetimeIndex(index)).astype(np.int64)
+
+    def align(self, frame: pd.DataFrame, name: str = "series") -> Tuple[pd.DataFrame, AlignmentReport]:
+        """
+        Place a frame's rows at their calendar positions.
+
+        Parameters:
+        - frame (pd.DataFrame): Data indexed by timestamp
+        - name (str): Label used in the report
+
+        Returns:
+        - tuple: (frame reindexed onto the sessions with NaN rows at gaps, AlignmentReport)
+        """
+        positions = self.positions(frame.index)
+        on_calendar = positions >= 0
+
+        values = np.full((len(self.sessions), frame.shape[1]), np.nan)
+        values[positions[on_calendar]] = frame.to_numpy(dtype=np.float64)[on_calendar]
+        aligned = pd.DataFrame(values, index=self.sessions, columns=frame.columns)
+
+        # Keep integer columns such as Volume integral where nothing is missing
+        for col in frame.columns:
+            if pd.api.types.is_integer_dtype(frame[col]) and not aligned[col].isna().any():
+                aligned[col] = aligned[col].astype(frame[col].dtype)
+
+        report = AlignmentReport(
+            missing={name: self.sessions[aligned.isna().any(axis=1).to_numpy()]},
+            extra={name: pd.DatetimeIndex(frame.index[~on_calendar])},
+        )
+        return aligned, report
+
+    def align_panel(
+        self, frames: Mapping[str, pd.DataFrame], column: str = "Close"
+    ) -> Tuple[pd.DataFrame, AlignmentReport]:
+        """
+        Align one column of many frames into a (sessions x symbols) panel.
+
+        Returns:
+        - tuple: (panel with NaN at missing bars, AlignmentReport)
+        """
+        panel = np.full((len(self.sessions), len(frames)), np.nan)
+        report = AlignmentReport()
+        for k, (name, frame) in enumerate(frames.items()):
+            aligned, single = self.align(frame[[column]], name)
+            panel[:, k] = aligned[column].to_numpy()
+            report.missing.update(single.missing)
+            report.extra.update(single.extra)
+        return pd.DataFrame(panel, index=self.sessions, columns=list(frames)), report
+
+
+def report_incomplete_rows(frame: pd.DataFrame, name: str) -> AlignmentReport:
+    """
+    Report rows of a frame that contain NaN values as missing bars.
+    """
+    return AlignmentReport(missing={name: pd.DatetimeIndex(frame.index[frame.isna().any(axis=1).to_numpy()])})
+
+
+def _first_dates(index: pd.DatetimeIndex, limit: int = 3) -> str:
+    if not len(index):
+        return ""
+    shown = ", ".join(str(ts.date()) for ts in index[:limit])
+    more = ", ..." if len(index) > limit else ""
+    return f" ({shown}{more})"
@@ -7,8 +7,10 @@ Utilities for loading historical price data from Yahoo Finance.
 @Date: 2025-06-19
 """
 
+from typing import List, Optional, Tuple
 import pandas as pd
 import yfinance as yf
+from backtest_engine.data.calendar import AlignmentReport, TradingCalendar, report_incomplete_rows
 
 
 def load_yahoo_data(ticker: str, start: str, end: str) -> pd.DataFrame:
@@ -41,6 +43,38 @@ def load_yahoo_data(ticker: str, start: str, end: str) -> pd.DataFrame:
 
     expected_cols = ["Open", "High", "Low", "Close", "Volume"]
     df = df[[col for col in expected_cols if col in df.columns]]
-    df.dropna(inplace=True)
 
-    return df
\ No newline at end of file
+    # Single-asset strategies need complete bars, but gaps are reported, not hidden
+    report_incomplete_rows(df, ticker).warn()
+    df = df.dropna()
+
+    return df
+
+
+def load_yahoo_panel(
+    tickers: List[str],
+    start: str,
+    end: str,
+    calendar: Optional[TradingCalendar] = None,
+    column: str = "Close",
+) -> Tuple[pd.DataFrame, AlignmentReport]:
+    """
+    Download several tickers and align one column onto a shared trading calendar.
+
+    Parameters:
+    - tickers (list): e.g. ['AAPL', 'MSFT']
+    - start (str): 'YYYY-MM-DD'
+    - end (str): 'YYYY-MM-DD'
+    - calendar (TradingCalendar, optional): Sessions to align onto; defaults to
+      the union of all tickers' trading days
+    - column (str): Column to place in the panel
+
+    Returns:
+    - tuple: (dates x tickers panel with NaN at missing bars, AlignmentReport)
+    """
+    frames = {ticker: load_yahoo_data(ticker, start, end) for ticker in tickers}
+    if calendar is None:
+        calendar = TradingCalendar.from_frames(frames)
+    panel, report = calendar.align_panel(frames, column)
+    report.warn()
+    return panel, report
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+@File: store.py
+
+Local on-disk store of per-symbol price frames.
+
+Prices are downloaded once and written as one pickle per symbol, so
+worker processes can each read just the symbols they need without
+re-downloading or receiving frames over a pipe.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import os
+from typing import Callable, Dict, Iterable, List, Optional
+import pandas as pd
+
+
+class LocalDataStore:
+    """
+    Directory of price frames, one file per symbol.
+    """
+
+    SUFFIX = ".pkl"
+
+    def __init__(self, root: str) -> None:
+        """
+        Parameters:
+        - root (str): Directory holding the store; created if missing
+        """
+        os.makedirs(root, exist_ok=True)
+        self.root = root
+
+    def path(self, symbol: str) -> str:
+        """
+        File backing a symbol.
+        """
+        return os.path.join(self.root, symbol.replace(os.sep, "_") + self.SUFFIX)
+
+    def __contains__(self, symbol: str) -> bool:
+        return os.path.exists(self.path(symbol))
+
+    def symbols(self) -> List[str]:
+        """
+        Sorted symbols currently in the store.
+        """
+        return sorted(
+            name[:-len(self.SUFFIX)] for name in os.listdir(self.root) if name.endswith(self.SUFFIX)
+        )
+
+    def save(self, symbol: str, frame: pd.DataFrame) -> None:
+        """
+        Write a symbol's prices, replacing any existing copy atomically.
+        """
+        path = self.path(symbol)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        frame.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+
+    def load(self, symbol: str) -> pd.DataFrame:
+        """
+        Read a symbol's prices; raises KeyError if it is not in the store.
+        """
+        if symbol not in self:
+            raise KeyError(f"{symbol} is not in the data store at {self.root}.")
+        return pd.read_pickle(self.path(symbol))
+
+    def populate(
+        self,
+        tickers: Iterable[str],
+        start: str,
+        end: str,
+        loader: Optional[Callable[[str, str, str], pd.DataFrame]] = None,
+        overwrite: bool = False,
+    ) -> Dict[str, str]:
+        """
+        Download tickers into the store, skipping ones already present.
+
+        Parameters:
+        - tickers (iterable): Symbols to fetch
+        - start (str): 'YYYY-MM-DD'
+        - end (str): 'YYYY-MM-DD'
+        - loader (callable, optional): (ticker, start, end) -> prices;
+          defaults to load_yahoo_data
+        - overwrite (bool): Re-download symbols already in the store
+
+        Returns:
+        - dict: Ticker -> error message for tickers that failed to load
+        """
+        if loader is None:
+            from backtest_engine.data.loader import load_yahoo_data
+            loader = load_yahoo_data
+
+        failures = {}
+        for ticker in tickers:
+            if ticker in self and not overwrite:
+                continue
+            try:
+                self.save(ticker, loader(ticker, start, end))
+            except Exception as exc:
+                failures[ticker] = f"{type(exc).__name__}: {exc}"
+        return failures
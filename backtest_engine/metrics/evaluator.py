@@ -9,6 +9,7 @@ Computes key performance metrics from portfolio equity curve.
 
 import numpy as np
 import pandas as pd
+from backtest_engine.core.precision import NS_PER_DAY
 
 
 def calculate_metrics(equity_curve: pd.Series) -> dict:
@@ -16,13 +17,16 @@ def calculate_metrics(equity_curve: pd.Series) -> dict:
     Compute common backtest metrics from a portfolio equity curve.
 
     Parameters:
-    - equity_curve (pd.Series): Portfolio value indexed by date
+    - equity_curve (pd.Series): Portfolio value indexed by date or by int64
+                                epoch nanoseconds (compact precision results)
 
     Returns:
     - dict: Metrics including CAGR, Sharpe, Max Drawdown
     """
+    # Reductions always run in float64, whatever the storage precision
+    equity_curve = equity_curve.astype(np.float64)
     returns = equity_curve.pct_change().dropna()
-    total_periods = (equity_curve.index[-1] - equity_curve.index[0]).days / 365.25
+    total_periods = _elapsed_days(equity_curve.index) / 365.25
 
     cagr = (equity_curve.iloc[-1] / equity_curve.iloc[0]) ** (1 / total_periods) - 1
 
@@ -39,3 +43,12 @@ def calculate_metrics(equity_curve: pd.Series) -> dict:
         "Final Value": round(equity_curve.iloc[-1], 2),
         "Start Value": round(equity_curve.iloc[0], 2),
     }
+
+
+def _elapsed_days(index: pd.Index) -> int:
+    """
+    Whole days between the first and last index entries.
+    """
+    if pd.api.types.is_integer_dtype(index):
+        return int(index[-1] - index[0]) // NS_PER_DAY
+    return (index[-1] - index[0]).days
@@ -0,0 +1,102 @@
+"""
+@File: cache.py
+
+Thread-safe LRU cache bounded by the memory held by its values.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+import numpy as np
+import pandas as pd
+
+
+def estimate_nbytes(value: Any) -> int:
+    """
+    Approximate memory held by a cached value.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True, index=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True, index=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, tuple):
+        return sum(estimate_nbytes(item) for item in value)
+    return 64
+
+
+class MemoryLRUCache:
+    """
+    Least-recently-used cache that evicts entries once their total size
+    exceeds `max_bytes`. A single entry larger than the cap is not stored.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """
+        Parameters:
+        - max_bytes (int): Upper bound on the summed size of cached values
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Return the cached value and mark it as recently used.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        size = estimate_nbytes(value)
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+
+class ScopedCache:
+    """
+    View of a shared cache whose keys are prefixed with `scope`, so one
+    memory budget can hold entries for many datasets.
+    """
+
+    def __init__(self, cache: MemoryLRUCache, scope: Hashable) -> None:
+        self.cache = cache
+        self.scope = scope
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        return self.cache.get((self.scope, key), default)
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.cache[(self.scope, key)] = value
@@ -0,0 +1,465 @@
+"""
+@File: server.py
+
+Long-lived local backtest service with warm data and indicator caches.
+
+The service keeps downloaded price frames and computed indicators in a
+memory-capped LRU cache. Jobs arriving within a short batching window
+that share a ticker, date range and starting cash are run together in
+one MultiStrategyRunner pass on a bounded worker pool. Jobs are accepted
+as JSON over HTTP on localhost:
+
+    POST /backtest  {"strategy": "MovingAverageCrossoverStrategy",
+                     "params": {"short_window": 20, "long_window": 50},
+                     "ticker": "AAPL", "start": "2012-01-01", "end": "2023-01-01"}
+    GET  /health
+
+Run with: python -m backtest_engine.service.server --port 8765
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import math
+import queue
+import threading
+import time
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Type
+import pandas as pd
+from backtest_engine.core.multi_runner import MultiStrategyRunner
+from backtest_engine.metrics.evaluator import calculate_metrics
+from backtest_engine.service.cache import MemoryLRUCache, ScopedCache
+from backtest_engine.core.precision import DOUBLE
+from backtest_engine.strategies.base_strategy import BaseStrategy, shared_prices
+from backtest_engine.strategies.moving_average_crossover import MovingAverageCrossoverStrategy
+from backtest_engine.strategies.rsi_mean_reversion import RSIMeanReversionStrategy
+
+STRATEGY_REGISTRY: Dict[str, Type[BaseStrategy]] = {
+    "MovingAverageCrossoverStrategy": MovingAverageCrossoverStrategy,
+    "RSIMeanReversionStrategy": RSIMeanReversionStrategy,
+}
+
+_STOP = object()
+
+
+def register_strategy(cls: Type[BaseStrategy]) -> Type[BaseStrategy]:
+    """
+    Make a strategy class available to service jobs by its class name.
+    Usable as a decorator.
+    """
+    STRATEGY_REGISTRY[cls.__name__] = cls
+    return cls
+
+
+@dataclass
+class BacktestJob:
+    """
+    A single backtest request.
+
+    Attributes:
+    - strategy (str): Registered strategy class name
+    - ticker (str): Symbol passed to the data loader
+    - start (str): 'YYYY-MM-DD'
+    - end (str): 'YYYY-MM-DD'
+    - params (dict): Keyword arguments for the strategy
+    - initial_cash (float): Starting portfolio value in cash
+    """
+    strategy: str
+    ticker: str
+    start: str
+    end: str
+    params: dict = field(default_factory=dict)
+    initial_cash: float = 10000.0
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BacktestJob":
+        try:
+            return cls(**data)
+        except TypeError as e:
+            raise ValueError(f"Invalid backtest job: {e}") from None
+
+    @property
+    def data_key(self) -> tuple:
+        return (self.ticker, self.start, self.end)
+
+
+class BacktestService:
+    """
+    In-process backtest service: warm caches, request batching and a bounded worker pool.
+    """
+
+    def __init__(
+        self,
+        loader: Optional[Callable[[str, str, str], pd.DataFrame]] = None,
+        max_workers: int = 4,
+        max_cache_bytes: int = 512 * 1024 ** 2,
+        batch_window: float = 0.005,
+        max_batch_size: int = 64,
+    ) -> None:
+        """
+        Parameters:
+        - loader (callable, optional): (ticker, start, end) -> price DataFrame;
+          defaults to load_yahoo_data
+        - max_workers (int): Worker threads running batches
+        - max_cache_bytes (int): Memory cap shared by price frames and indicators
+        - batch_window (float): Seconds to wait for more jobs to batch together
+        - max_batch_size (int): Most jobs collected into one batch
+        """
+        if loader is None:
+            from backtest_engine.data.loader import load_yahoo_data
+            loader = load_yahoo_data
+        self.loader = loader
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.cache = MemoryLRUCache(max_cache_bytes)
+        self.stats = {"jobs": 0, "batches": 0, "loads": 0}
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = False
+        self._submit_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._stats_lock = threading.Lock()
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, daemon=True)
+        self._dispatcher.start()
+
+    def submit(self, job: BacktestJob) -> Future:
+        """
+        Queue a job for batched execution.
+
+        Returns:
+        - Future: Resolves to the job result dict (see `_job_result`)
+
+        Raises:
+        - RuntimeError: If the service has been closed
+        """
+        if job.strategy not in STRATEGY_REGISTRY:
+            raise ValueError(f"Unknown strategy: {job.strategy}")
+        try:
+            inspect.signature(STRATEGY_REGISTRY[job.strategy]).bind(None, **job.params)
+        except TypeError as e:
+            raise ValueError(f"Invalid parameters for {job.strategy}: {e}") from None
+        future: Future = Future()
+        with self._submit_lock:
+            if self._closed:
+                raise RuntimeError("BacktestService is closed.")
+            self._queue.put((job, future))
+        return future
+
+    def run(self, job: BacktestJob, timeout: Optional[float] = None) -> dict:
+        """
+        Submit a job and wait for its result.
+        """
+        return self.submit(job).result(timeout=timeout)
+
+    def close(self) -> None:
+        """
+        Stop accepting jobs, finish queued ones and shut down the workers.
+        """
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(_STOP)
+        self._dispatcher.join()
+        self._pool.shutdown(wait=True)
+
+    def _dispatch_loop(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            groups = defaultdict(list)
+            for job, future in batch:
+                groups[job.data_key + (job.initial_cash,)].append((job, future))
+            for items in groups.values():
+                self._pool.submit(self._run_group, items)
+
+    def _run_group(self, items: List[tuple]) -> None:
+        """
+        Run jobs sharing a dataset and starting cash in one multi-strategy pass.
+        """
+        live = [(job, future) for job, future in items if future.set_running_or_notify_cancel()]
+        if not live:
+            return
+        with self._stats_lock:
+            self.stats["batches"] += 1
+            self.stats["jobs"] += len(live)
+
+        job = live[0][0]
+        try:
+            prices, fingerprint = self._prices(job)
+        except Exception as e:
+            for _, future in live:
+                future.set_exception(e)
+            return
+
+        # Build and validate each job's strategy on its own, so one bad job
+        # does not fail the others batched with it
+        valid = []
+        with shared_prices(prices, DOUBLE):
+            for j, future in live:
+                try:
+                    factory = _strategy_factory(j.strategy, j.params)
+                    factory(prices).signal_expressions()
+                except Exception as e:
+                    future.set_exception(e)
+                else:
+                    valid.append((factory, future))
+        if not valid:
+            return
+
+        # Indicators are scoped by price content, so a re-downloaded frame
+        # with different rows never reuses stale arrays
+        indicator_cache = ScopedCache(self.cache, ("indicators", fingerprint))
+        try:
+            runner = MultiStrategyRunner(
+                prices,
+                {str(i): factory for i, (factory, _) in enumerate(valid)},
+                initial_cash=job.initial_cash,
+                indicator_cache=indicator_cache,
+            )
+            equity = runner.run()
+        except Exception as e:
+            if len(valid) == 1:
+                valid[0][1].set_exception(e)
+                return
+            # Fall back to one pass per job to isolate the failing one
+            for factory, future in valid:
+                try:
+                    runner = MultiStrategyRunner(
+                        prices, {"0": factory}, initial_cash=job.initial_cash, indicator_cache=indicator_cache
+                    )
+                    result = _job_result(runner.run()["0"], runner.trade_logs["0"])
+                except Exception as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            return
+
+        for i, (_, future) in enumerate(valid):
+            try:
+                result = _job_result(equity[str(i)], runner.trade_logs[str(i)])
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def _prices(self, job: BacktestJob) -> tuple:
+        """
+        Price frame for a job and its content fingerprint, loaded on a cache miss.
+        """
+        key = ("prices",) + job.data_key
+        entry = self.cache.get(key)
+        if entry is None:
+            prices = self.loader(job.ticker, job.start, job.end)
+            with self._stats_lock:
+                self.stats["loads"] += 1
+            entry = (prices, _fingerprint(prices))
+            self.cache[key] = entry
+        return entry
+
+
+def _fingerprint(prices: pd.DataFrame) -> str:
+    """
+    Content hash of a price frame: index, column names and values.
+    """
+    h = hashlib.sha256(repr(list(prices.columns)).encode())
+    h.update(pd.util.hash_pandas_object(prices, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _strategy_factory(name: str, params: dict) -> Callable[[pd.DataFrame], BaseStrategy]:
+    cls = STRATEGY_REGISTRY[name]
+    return lambda prices: cls(prices, **params)
+
+
+def _job_result(equity: pd.Series, trades: list) -> dict:
+    """
+    JSON-compatible result: equity curve, trades and metrics.
+
+    Non-finite numbers, such as the Sharpe ratio of a flat equity curve,
+    become None since JSON has no NaN or infinity.
+    """
+    return {
+        "equity": [[date.isoformat(), _finite(value)] for date, value in equity.items()],
+        "trades": [
+            {
+                "date": trade.date.isoformat(),
+                "type": trade.type,
+                "price": _finite(trade.price),
+                "shares": _finite(trade.shares),
+                "pnl": _finite(trade.pnl),
+            }
+            for trade in trades
+        ],
+        "metrics": {k: _finite(v) for k, v in calculate_metrics(equity).items()} if len(equity) > 1 else {},
+    }
+
+
+def _finite(value) -> Optional[float]:
+    """
+    `value` as a float, or None if it is NaN or infinite.
+    """
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+# === HTTP front end ===
+
+class _Handler(BaseHTTPRequestHandler):
+    service: BacktestService = None
+
+    def do_GET(self) -> None:
+        if self.path != "/health":
+            self._send(404, {"error": "Not found"})
+            return
+        self._send(200, {
+            "status": "ok",
+            "stats": dict(self.service.stats),
+            "cache_bytes": self.service.cache.current_bytes,
+        })
+
+    def do_POST(self) -> None:
+        if self.path != "/backtest":
+            self._send(404, {"error": "Not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            jobs = payload if isinstance(payload, list) else [payload]
+            futures = [self.service.submit(BacktestJob.from_dict(job)) for job in jobs]
+        except ValueError as e:
+            self._send(400, {"error": str(e)})
+            return
+        except RuntimeError as e:
+            self._send(503, {"error": str(e)})
+            return
+
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append({"error": f"{type(e).__name__}: {e}"})
+        self._send(200, results if isinstance(payload, list) else results[0])
+
+    def _send(self, status: int, body) -> None:
+        data = json.dumps(body, allow_nan=False).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class BacktestServer:
+    """
+    HTTP server exposing a BacktestService on a local address.
+    """
+
+    def __init__(self, service: BacktestService, host: str = "127.0.0.1", port: int = 0) -> None:
+        """
+        Parameters:
+        - service (BacktestService): Service executing the jobs
+        - host (str): Interface to bind, localhost by default
+        - port (int): Port to bind; 0 picks a free port
+        """
+        handler = type("BacktestHandler", (_Handler,), {"service": service})
+        self.service = service
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "BacktestServer":
+        """
+        Serve requests on a background thread.
+        """
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop serving and shut down the underlying service.
+        """
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self.service.close()
+
+
+def request_backtest(url: str, job, timeout: float = 60.0):
+    """
+    Send one job dict (or a list of them) to a running server.
+
+    Returns:
+    - dict or list: Result(s) as returned by the server
+    """
+    request = urllib.request.Request(
+        f"{url}/backtest",
+        data=json.dumps(job).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the local backtest service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--cache-mb", type=int, default=512)
+    args = parser.parse_args()
+
+    server = BacktestServer(
+        BacktestService(max_workers=args.workers, max_cache_bytes=args.cache_mb * 1024 ** 2),
+        host=args.host,
+        port=args.port,
+    )
+    print(f"Serving backtests on {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        server.service.close()
+
+
+if __name__ == "__main__":
+    main()
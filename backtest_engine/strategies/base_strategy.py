@@ -10,8 +10,37 @@ in order to be compatible with the backtesting engine.
 @Date: 2025-06-17
 """
 
+import threading
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
 import pandas as pd
+from backtest_engine.core.precision import DOUBLE, PrecisionPolicy
+from backtest_engine.core.signals import SparseSignals
+from backtest_engine.strategies.expressions import Expr
+
+_shared = threading.local()
+
+
+@contextmanager
+def shared_prices(prices: pd.DataFrame, precision: PrecisionPolicy) -> Iterator[None]:
+    """
+    Let strategies built inside the block use `prices` as-is instead of copying it.
+
+    Only applies to strategies constructed with this exact frame and precision
+    policy, on the current thread, whose class sets `shares_prices`. The frame
+    must already be cast to the policy; every other strategy gets its own copy.
+
+    Parameters:
+    - prices (pd.DataFrame): Price data already prepared with `precision.cast_prices`
+    - precision (PrecisionPolicy): Policy the frame was cast with
+    """
+    previous = getattr(_shared, "frame", None)
+    _shared.frame = (prices, precision)
+    try:
+        yield
+    finally:
+        _shared.frame = previous
 
 
 class BaseStrategy(ABC):
@@ -26,15 +55,33 @@ class BaseStrategy(ABC):
        -1  -> Sell
     """
 
-    def __init__(self, prices: pd.DataFrame) -> None:
+    # Set to True on a class that never modifies `self.prices`, so it can read a
+    # frame shared through `shared_prices`. Not inherited: a subclass may add
+    # columns, so it gets its own copy unless it opts in as well.
+    shares_prices = False
+
+    # Attributes holding state derived from prices and parameters, such as
+    # cached indicators, rather than parameters. Memoization leaves them out of
+    # a strategy's content hash. Each class lists only its own; they are
+    # collected over the class hierarchy.
+    derived_attrs = ("indicators",)
+
+    def __init__(self, prices: pd.DataFrame, precision: PrecisionPolicy = DOUBLE) -> None:
         """
         Initialize the strategy with historical price data.
 
         Parameters:
         - prices (pd.DataFrame): Historical OHLCV data indexed by date,
                                  with at least a 'Close' column.
+        - precision (PrecisionPolicy): Dtypes for prices, indicators and signals
         """
-        self.prices = prices.copy()
+        self.precision = precision
+        frame = getattr(_shared, "frame", None)
+        opted_in = vars(type(self)).get("shares_prices", False)
+        if opted_in and frame is not None and frame[0] is prices and frame[1] == precision:
+            self.prices = prices
+        else:
+            self.prices = precision.cast_prices(prices)
         self._validate_prices()
 
     @abstractmethod
@@ -47,6 +94,42 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def generate_events(self) -> SparseSignals:
+        """
+        Generate signals as sparse buy/sell events.
+
+        The default collapses `generate_signals`; strategies that trade
+        rarely can override this to emit events without a dense Series.
+
+        Returns:
+        - SparseSignals: Event positions and actions over the prices index
+        """
+        return SparseSignals.from_dense(self.generate_signals())
+
+    def signal_expressions(self) -> Optional[Tuple[Expr, Optional[Expr]]]:
+        """
+        Describe the strategy as (buy, sell) signal expressions, if possible.
+
+        Strategies that return expressions can have their indicators computed
+        in a plan shared with other strategies (see MultiStrategyRunner).
+        The expressions must produce the same signals as `generate_signals`.
+
+        Returns:
+        - tuple or None: (buy, sell) expressions, sell may be None
+        """
+        return None
+
+    @property
+    def warmup(self) -> Optional[int]:
+        """
+        Number of bars preceding a bar that its signal depends on.
+
+        Signals computed over only the last `warmup` bars plus new bars must
+        match those of a run over the full history. None means the signal may
+        depend on all prior bars, so the strategy cannot be resumed.
+        """
+        return None
+
     def _validate_prices(self) -> None:
         """
         Validate that the price DataFrame contains required columns.
@@ -0,0 +1,142 @@
+"""
+@File: cross_sectional.py
+
+Vectorized cross-sectional primitives over (dates x symbols) arrays.
+
+Every function works on whole 2-D arrays at once, one row per date and
+one column per symbol, with NaN marking a missing value. No function
+loops over symbols, so they scale to thousands of columns.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+from typing import Tuple
+import numpy as np
+
+
+def rank(x: np.ndarray) -> np.ndarray:
+    """
+    Percentile rank of each value within its row.
+
+    Matches pandas `rank(axis=1, method="first", pct=True)`: the smallest
+    value gets 1/n and the largest 1, where n counts non-NaN values.
+
+    Parameters:
+    - x (np.ndarray): 2-D array (dates x symbols)
+
+    Returns:
+    - np.ndarray: Ranks in (0, 1], NaN where x is NaN
+    """
+    x = np.asarray(x)
+    valid = ~np.isnan(x)
+    order = np.argsort(x, axis=1, kind="stable")  # NaNs sort last
+    ordinal = np.empty_like(order)
+    np.put_along_axis(ordinal, order, np.arange(x.shape[1])[None, :], axis=1)
+    counts = valid.sum(axis=1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ranks = (ordinal + 1) / counts
+    return np.where(valid, ranks, np.nan).astype(_float_dtype(x), copy=False)
+
+
+def zscore(x: np.ndarray) -> np.ndarray:
+    """
+    Cross-sectional z-score of each value within its row (population std).
+
+    Rows with zero dispersion produce NaN.
+    """
+    x = np.asarray(x)
+    valid_counts = (~np.isnan(x)).sum(axis=1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.nansum(x, axis=1, keepdims=True) / valid_counts
+        centered = x - mean
+        std = np.sqrt(np.nansum(centered * centered, axis=1, keepdims=True) / valid_counts)
+        z = centered / std
+    z[~np.isfinite(z)] = np.nan
+    return z
+
+
+def top_k(x: np.ndarray, k: int) -> np.ndarray:
+    """
+    Boolean mask of the `k` largest non-NaN values in each row.
+
+    Rows with fewer than `k` valid values select all of them.
+    """
+    x = np.asarray(x)
+    k = min(k, x.shape[1])
+    if k <= 0:
+        return np.zeros(x.shape, dtype=bool)
+    filled = np.where(np.isnan(x), -np.inf, x)
+    idx = np.argpartition(-filled, k - 1, axis=1)[:, :k]
+    mask = np.zeros(x.shape, dtype=bool)
+    np.put_along_axis(mask, idx, True, axis=1)
+    return mask & ~np.isnan(x)
+
+
+def bottom_k(x: np.ndarray, k: int) -> np.ndarray:
+    """
+    Boolean mask of the `k` smallest non-NaN values in each row.
+    """
+    return top_k(-np.asarray(x), k)
+
+
+def rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing sum over `window` rows of every column; NaN until the window is full
+    or when any value in the window is NaN.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    csum = np.cumsum(np.nan_to_num(x), axis=0)
+    nan_count = np.cumsum(np.isnan(x), axis=0)
+    out = csum.copy()
+    out[window:] -= csum[:-window]
+    bad = nan_count.copy()
+    bad[window:] -= nan_count[:-window]
+    out[bad > 0] = np.nan
+    out[:window - 1] = np.nan
+    return out
+
+
+def rolling_zscore(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Time-series z-score of each column against its trailing `window` rows.
+    """
+    mean = rolling_sum(x, window) / window
+    mean_sq = rolling_sum(np.asarray(x, dtype=np.float64) ** 2, window) / window
+    with np.errstate(invalid="ignore", divide="ignore"):
+        std = np.sqrt(np.maximum(mean_sq - mean ** 2, 0.0))
+        z = (x - mean) / std
+    z[~np.isfinite(z)] = np.nan
+    return z
+
+
+def rolling_spread(y: np.ndarray, x: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling OLS hedge ratio and spread for pairs, one pair per column.
+
+    beta_t = cov(y, x) / var(x) over the trailing `window` rows and
+    spread_t = y_t - beta_t * x_t. A stationary spread indicates the pair
+    is cointegrated over the window.
+
+    Parameters:
+    - y (np.ndarray): 2-D array of dependent legs (dates x pairs)
+    - x (np.ndarray): 2-D array of hedge legs, same shape as y
+
+    Returns:
+    - tuple: (beta, spread) arrays of the same shape as y
+    """
+    y = np.asarray(y, dtype=np.float64)
+    x = np.asarray(x, dtype=np.float64)
+    n = float(window)
+    sum_x = rolling_sum(x, window)
+    sum_y = rolling_sum(y, window)
+    sum_xy = rolling_sum(x * y, window)
+    sum_xx = rolling_sum(x * x, window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        beta = (sum_xy - sum_x * sum_y / n) / (sum_xx - sum_x * sum_x / n)
+    beta[~np.isfinite(beta)] = np.nan
+    return beta, y - beta * x
+
+
+def _float_dtype(x: np.ndarray) -> np.dtype:
+    return x.dtype if np.issubdtype(x.dtype, np.floating) else np.dtype(np.float64)
@@ -0,0 +1,88 @@
+"""
+@File: cross_sectional_momentum.py
+
+Cross-sectional momentum strategy over a price panel.
+
+Ranks symbols by trailing return and holds the strongest (and optionally
+shorts the weakest) in equal weights, rebalancing on a fixed schedule.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import numpy as np
+import pandas as pd
+from backtest_engine.core.precision import DOUBLE, PrecisionPolicy
+from backtest_engine.strategies.cross_sectional import bottom_k, top_k
+from backtest_engine.strategies.panel_strategy import PanelStrategy
+
+
+class CrossSectionalMomentumStrategy(PanelStrategy):
+    """
+    Cross-Sectional Momentum Strategy.
+
+    Long: The `top_k` symbols by trailing `lookback` return
+    Short: The `top_k` weakest symbols (when long_short is True)
+    Rebalance: Every `rebalance` bars; weights are held in between
+    """
+
+    def __init__(
+        self,
+        prices: pd.DataFrame,
+        lookback: int = 126,
+        top_k: int = 50,
+        rebalance: int = 21,
+        long_short: bool = False,
+        precision: PrecisionPolicy = DOUBLE,
+    ) -> None:
+        """
+        Initialize strategy with a price panel and ranking parameters.
+
+        Parameters:
+        - prices (pd.DataFrame): Close prices, one column per symbol
+        - lookback (int): Bars used for the trailing return
+        - top_k (int): Symbols held on each side
+        - rebalance (int): Bars between rebalances
+        - long_short (bool): Also short the weakest symbols
+        - precision (PrecisionPolicy): Dtype for prices and weights
+        """
+        super().__init__(prices, precision)
+        self.lookback = lookback
+        self.top_k = top_k
+        self.rebalance = rebalance
+        self.long_short = long_short
+
+    def momentum(self) -> np.ndarray:
+        """
+        Trailing `lookback`-bar return of every symbol (NaN until available).
+        """
+        momentum = np.full(self.values.shape, np.nan, dtype=self.values.dtype)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            momentum[self.lookback:] = self.values[self.lookback:] / self.values[:-self.lookback] - 1
+        return momentum
+
+    def generate_weights(self) -> pd.DataFrame:
+        """
+        Equal-weight the strongest (and weakest) symbols on rebalance dates.
+
+        Returns:
+        - pd.DataFrame: Target weights; long legs sum to 1 (0.5 per side if long-short)
+        """
+        n_dates = len(self.values)
+        rebalance_rows = np.arange(self.lookback, n_dates, self.rebalance)
+        momentum = self.momentum()[rebalance_rows]
+
+        side = 0.5 if self.long_short else 1.0
+        longs = top_k(momentum, self.top_k)
+        targets = side * longs / np.maximum(longs.sum(axis=1, keepdims=True), 1)
+        if self.long_short:
+            shorts = bottom_k(momentum, self.top_k) & ~longs
+            targets -= side * shorts / np.maximum(shorts.sum(axis=1, keepdims=True), 1)
+
+        # Hold each rebalance's targets until the next one
+        weights = np.zeros(self.values.shape)
+        if len(rebalance_rows):
+            period = np.searchsorted(rebalance_rows, np.arange(n_dates), side="right") - 1
+            held = period >= 0
+            weights[held] = targets[period[held]]
+        return self._weights_frame(weights)
@@ -0,0 +1,105 @@
+"""
+@File: expression_strategy.py
+
+Strategy defined by buy/sell signal expressions instead of a subclass.
+
+Example:
+    ExpressionStrategy(
+        prices,
+        buy=crossover(sma(close, 20), sma(close, 50)) & (rsi(close, 14) < 30),
+        sell=crossunder(sma(close, 20), sma(close, 50)),
+    )
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+from typing import Optional, Tuple
+import numpy as np
+import pandas as pd
+from backtest_engine.core.precision import DOUBLE, PrecisionPolicy
+from backtest_engine.strategies.base_strategy import BaseStrategy
+from backtest_engine.strategies.expressions import Expr, compile_expressions
+
+
+class ExpressionStrategy(BaseStrategy):
+    """
+    Expression-driven strategy.
+
+    Buy Signal: Bars where the `buy` expression is true
+    Sell Signal: Bars where the `sell` expression is true (wins over buy)
+    Hold: Otherwise
+    """
+
+    shares_prices = True
+    derived_attrs = ("program",)
+
+    def __init__(
+        self,
+        prices: pd.DataFrame,
+        buy: Expr,
+        sell: Optional[Expr] = None,
+        precision: PrecisionPolicy = DOUBLE,
+    ) -> None:
+        """
+        Initialize strategy with price data and signal expressions.
+
+        Parameters:
+        - prices (pd.DataFrame): OHLCV price data with 'Close' column
+        - buy (Expr): Boolean expression marking buy bars
+        - sell (Expr, optional): Boolean expression marking sell bars
+        - precision (PrecisionPolicy): Dtypes for prices, indicators and signals
+        """
+        super().__init__(prices, precision)
+        self.buy = buy
+        self.sell = sell
+        self.program = compile_expressions(*[e for e in (buy, sell) if e is not None])
+
+        missing = self.program.columns - set(self.prices.columns)
+        if missing:
+            raise ValueError(f"Missing required columns in price data: {missing}")
+
+    @property
+    def warmup(self) -> int:
+        """
+        Longest lookback of the buy and sell expressions.
+        """
+        return max(e.lookback for e in self.program.roots)
+
+    def signal_expressions(self) -> Tuple[Expr, Optional[Expr]]:
+        return self.buy, self.sell
+
+    def generate_signals(self) -> pd.Series:
+        """
+        Evaluate the compiled expressions into a Series of trading signals.
+
+        Returns:
+        - pd.Series of signals: 1 for buy, -1 for sell, 0 for hold
+        """
+        masks = self.program.evaluate(self.prices, dtype=self.precision.float_dtype)
+        sell_mask = masks[1] if self.sell is not None else None
+        signal = combine_signals(masks[0], sell_mask, self.precision.signal_dtype)
+        return pd.Series(signal, index=self.prices.index)
+
+
+def combine_signals(buy_mask: np.ndarray, sell_mask: Optional[np.ndarray], dtype=np.int64) -> np.ndarray:
+    """
+    Turn boolean buy/sell masks into signal values, with sell winning ties.
+
+    Parameters:
+    - buy_mask (np.ndarray): Boolean mask of buy bars
+    - sell_mask (np.ndarray, optional): Boolean mask of sell bars
+    - dtype (np.dtype): Signal dtype
+
+    Returns:
+    - np.ndarray: 1 for buy, -1 for sell, 0 for hold
+    """
+    for mask in (buy_mask, sell_mask):
+        if mask is not None and mask.dtype != np.bool_:
+            raise TypeError("Signal expressions must evaluate to booleans (use comparisons).")
+
+    signal = np.zeros(len(buy_mask), dtype=dtype)
+    signal[buy_mask] = 1
+    if sell_mask is not None:
+        signal[sell_mask] = -1
+    return signal
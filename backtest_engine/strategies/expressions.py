@@ -0,0 +1,460 @@
+"""
+@File: expressions.py
+
+Composable signal expressions compiled to a single vectorized pass.
+
+Rules are written as ordinary Python expressions over price columns, e.g.
+
+    crossover(sma(close, 20), sma(close, 50)) & (rsi(close, 14) < 30)
+
+which builds an expression graph instead of computing anything. Compiling
+one or more graphs merges identical subexpressions, orders the nodes by
+dependency and evaluates each node exactly once over NumPy arrays,
+releasing or reusing intermediate buffers as soon as nothing reads them.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+from typing import Dict, List, MutableMapping, Optional, Set, Tuple, Union
+import numpy as np
+import pandas as pd
+
+
+class Expr:
+    """
+    A node in a signal expression graph.
+
+    Nodes are immutable and identified by their structural `key`, so two
+    independently built but identical subexpressions compile to one node.
+    """
+
+    __slots__ = ("op", "args", "params", "_key")
+
+    def __init__(self, op: str, args: Tuple["Expr", ...] = (), params: tuple = ()) -> None:
+        self.op = op
+        self.args = args
+        self.params = params
+        self._key = None
+
+    @property
+    def key(self) -> tuple:
+        """
+        Structural identity of the node, used for common subexpression elimination.
+        """
+        if self._key is None:
+            self._key = (self.op, self.params, tuple(arg.key for arg in self.args))
+        return self._key
+
+    @property
+    def lookback(self) -> int:
+        """
+        Number of preceding bars needed for the value at a bar to match a run
+        over the full history.
+        """
+        inner = max((arg.lookback for arg in self.args), default=0)
+        if self.op == "shift":
+            return inner + self.params[0]
+        if self.op == "sma":
+            # The first full window is still summed as a running prefix sum
+            # (see _rolling_sum), so one bar more than the window is needed
+            return inner + self.params[0]
+        if self.op == "rsi":
+            return inner + self.params[0]
+        return inner
+
+    def __repr__(self) -> str:
+        if self.op == "column":
+            return self.params[0].lower()
+        if self.op == "const":
+            return repr(self.params[0])
+        if self.op in _BINARY_SYMBOLS:
+            return f"({self.args[0]!r} {_BINARY_SYMBOLS[self.op]} {self.args[1]!r})"
+        if self.op == "neg":
+            return f"-{self.args[0]!r}"
+        if self.op == "not":
+            return f"~{self.args[0]!r}"
+        parts = [repr(arg) for arg in self.args] + [repr(p) for p in self.params]
+        return f"{self.op}({', '.join(parts)})"
+
+    def __bool__(self) -> bool:
+        raise TypeError(
+            "Expressions have no truth value; use '&', '|' and '~' instead of 'and', 'or' and 'not'."
+        )
+
+    # Arithmetic
+    def __add__(self, other): return Expr("add", (self, _as_expr(other)))
+    def __radd__(self, other): return Expr("add", (_as_expr(other), self))
+    def __sub__(self, other): return Expr("sub", (self, _as_expr(other)))
+    def __rsub__(self, other): return Expr("sub", (_as_expr(other), self))
+    def __mul__(self, other): return Expr("mul", (self, _as_expr(other)))
+    def __rmul__(self, other): return Expr("mul", (_as_expr(other), self))
+    def __truediv__(self, other): return Expr("div", (self, _as_expr(other)))
+    def __rtruediv__(self, other): return Expr("div", (_as_expr(other), self))
+    def __neg__(self): return Expr("neg", (self,))
+
+    # Comparisons (== and != are left alone so nodes stay hashable)
+    def __gt__(self, other): return Expr("gt", (self, _as_expr(other)))
+    def __lt__(self, other): return Expr("lt", (self, _as_expr(other)))
+    def __ge__(self, other): return Expr("ge", (self, _as_expr(other)))
+    def __le__(self, other): return Expr("le", (self, _as_expr(other)))
+
+    # Boolean logic
+    def __and__(self, other): return Expr("and", (self, _as_expr(other)))
+    def __rand__(self, other): return Expr("and", (_as_expr(other), self))
+    def __or__(self, other): return Expr("or", (self, _as_expr(other)))
+    def __ror__(self, other): return Expr("or", (_as_expr(other), self))
+    def __invert__(self): return Expr("not", (self,))
+
+
+def _as_expr(value: Union[Expr, float, int, bool]) -> Expr:
+    """
+    Wrap a Python scalar as a constant node.
+    """
+    if isinstance(value, Expr):
+        return value
+    if isinstance(value, (bool, np.bool_)):
+        return Expr("const", (), (bool(value),))
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return Expr("const", (), (float(value),))
+    raise TypeError(f"Cannot use {type(value).__name__} in a signal expression.")
+
+
+# === Building blocks ===
+
+def column(name: str) -> Expr:
+    """
+    Reference a column of the price DataFrame, e.g. column('Close').
+    """
+    return Expr("column", (), (name,))
+
+
+close = column("Close")
+open_ = column("Open")
+high = column("High")
+low = column("Low")
+volume = column("Volume")
+
+
+def shift(x: Expr, periods: int = 1) -> Expr:
+    """
+    Value of `x` lagged by `periods` bars (NaN, or False for booleans, before the start).
+    """
+    if periods < 0:
+        raise ValueError("shift periods must be non-negative.")
+    return Expr("shift", (_as_expr(x),), (int(periods),))
+
+
+def sma(x: Expr, window: int, min_periods: int = 1) -> Expr:
+    """
+    Simple moving average of `x`.
+
+    Defaults to min_periods=1, matching MovingAverageCrossoverStrategy.
+    """
+    if window < 1 or not 1 <= min_periods <= window:
+        raise ValueError("sma requires window >= 1 and 1 <= min_periods <= window.")
+    return Expr("sma", (_as_expr(x),), (int(window), int(min_periods)))
+
+
+def rsi(x: Expr, window: int = 14) -> Expr:
+    """
+    Relative Strength Index of `x` using simple averages, matching RSIMeanReversionStrategy.
+    """
+    if window < 1:
+        raise ValueError("rsi requires window >= 1.")
+    return Expr("rsi", (_as_expr(x),), (int(window),))
+
+
+def crossover(a: Expr, b: Expr) -> Expr:
+    """
+    True on bars where `a` moves above `b` (it was not above on the previous bar).
+    """
+    above = _as_expr(a) > _as_expr(b)
+    return above & ~shift(above)
+
+
+def crossunder(a: Expr, b: Expr) -> Expr:
+    """
+    True on bars where `a` moves below `b` (it was not below on the previous bar).
+    """
+    below = _as_expr(a) < _as_expr(b)
+    return below & ~shift(below)
+
+
+# === Kernels ===
+
+_BINARY_UFUNCS = {
+    "add": np.add,
+    "sub": np.subtract,
+    "mul": np.multiply,
+    "div": np.true_divide,
+    "gt": np.greater,
+    "lt": np.less,
+    "ge": np.greater_equal,
+    "le": np.less_equal,
+    "and": np.logical_and,
+    "or": np.logical_or,
+}
+
+_UNARY_UFUNCS = {
+    "neg": np.negative,
+    "not": np.logical_not,
+}
+
+_CACHEABLE_OPS = {"sma", "rsi"}
+
+_BOOL_OPS = {"gt", "lt", "ge", "le", "and", "or", "not"}
+
+_BINARY_SYMBOLS = {
+    "add": "+", "sub": "-", "mul": "*", "div": "/",
+    "gt": ">", "lt": "<", "ge": ">=", "le": "<=",
+    "and": "&", "or": "|",
+}
+
+
+def _rolling_mean(x: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """
+    Trailing mean over `window` bars, ignoring NaNs.
+
+    Each output is summed from its own window in a fixed order, so the value
+    at a bar does not depend on how much history precedes the window.
+    """
+    valid = ~np.isnan(x)
+    total = _rolling_sum(np.where(valid, x, 0.0), window)
+    seen = np.cumsum(valid, dtype=np.int64)
+    count = seen.copy()
+    count[window:] -= seen[:-window]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.divide(total, count, dtype=total.dtype)
+    mean[count < min_periods] = np.nan
+    return mean
+
+
+def _rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing sum over `window` bars in O(n log window).
+
+    Sums of 1, 2, 4, ... consecutive bars are built by doubling, and each
+    window is assembled from the blocks matching the set bits of `window`,
+    nearest block first. Both steps only ever combine values inside the
+    window in a fixed order, so results stay history-independent.
+
+    The first `window` bars use a plain running sum instead. Up to and
+    including the first full window, sums over the same leading bars are
+    then identical for every window length, so MAs of different lengths tie
+    exactly there, as they mathematically do.
+    """
+    n = len(x)
+    total = np.zeros_like(x)
+    block = x  # sums of `size` consecutive bars ending at each bar
+    size, offset = 1, 0
+    while size <= window:
+        if window & size:
+            total[offset:] += block[:max(n - offset, 0)]
+            offset += size
+        size *= 2
+        if size <= window:
+            doubled = block.copy()
+            doubled[size // 2:] += block[:max(n - size // 2, 0)]
+            block = doubled
+
+    head = min(window, n)
+    total[:head] = np.cumsum(x[:head])
+    return total
+
+
+def _rsi(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    RSI with simple rolling averages of gains and losses.
+    """
+    delta = np.empty_like(x)
+    delta[:1] = np.nan
+    np.subtract(x[1:], x[:-1], out=delta[1:])
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    rs = _rolling_mean(gain, window, window) / _rolling_mean(loss, window, window)
+    return 100 - (100 / (1 + rs))
+
+
+def _shift(x: np.ndarray, periods: int) -> np.ndarray:
+    out = np.empty_like(x)
+    fill = False if x.dtype == np.bool_ else np.nan
+    n = min(periods, len(x))
+    out[:n] = fill
+    if periods < len(x):
+        out[periods:] = x[:len(x) - periods]
+    return out
+
+
+# === Compilation ===
+
+class CompiledExpressions:
+    """
+    One or more expressions compiled into a single evaluation plan.
+
+    Identical subexpressions across all roots are evaluated once. Nodes run
+    in dependency order and each intermediate array is dropped (or reused as
+    the output buffer of the node that reads it last) as soon as possible.
+    """
+
+    def __init__(self, *roots: Expr) -> None:
+        """
+        Parameters:
+        - *roots (Expr): Expressions whose values `evaluate` returns, in order
+        """
+        if not roots:
+            raise ValueError("At least one expression is required.")
+        self.roots = tuple(_as_expr(r) for r in roots)
+
+        slots: Dict[tuple, int] = {}
+        self._nodes: List[Expr] = []
+        self._arg_slots: List[Tuple[int, ...]] = []
+
+        def visit(node: Expr) -> int:
+            key = node.key
+            if key in slots:
+                return slots[key]
+            arg_slots = tuple(visit(arg) for arg in node.args)
+            slots[key] = len(self._nodes)
+            self._nodes.append(node)
+            self._arg_slots.append(arg_slots)
+            return slots[key]
+
+        self._root_slots = tuple(visit(r) for r in self.roots)
+
+        never = len(self._nodes)
+        self._last_use = [-1] * len(self._nodes)
+        for i, arg_slots in enumerate(self._arg_slots):
+            for j in arg_slots:
+                self._last_use[j] = i
+        for j in self._root_slots:
+            self._last_use[j] = never
+
+    @property
+    def columns(self) -> Set[str]:
+        """
+        Price columns read by the compiled expressions.
+        """
+        return {node.params[0] for node in self._nodes if node.op == "column"}
+
+    @property
+    def node_count(self) -> int:
+        """
+        Number of distinct nodes after common subexpression elimination.
+        """
+        return len(self._nodes)
+
+    def evaluate(
+        self,
+        prices: pd.DataFrame,
+        dtype=np.float64,
+        cache: Optional[MutableMapping] = None,
+    ) -> List[np.ndarray]:
+        """
+        Evaluate every root expression over the price data.
+
+        Parameters:
+        - prices (pd.DataFrame): Price data containing all referenced columns
+        - dtype (np.dtype): Float dtype for columns and indicators
+        - cache (MutableMapping, optional): Window indicators (sma, rsi) keyed by
+          (node key, dtype), reused across calls. Must only ever be used with
+          these same prices.
+
+        Returns:
+        - list of np.ndarray: One array per root, aligned with prices index
+        """
+        missing = self.columns - set(prices.columns)
+        if missing:
+            raise ValueError(f"Missing required columns in price data: {missing}")
+
+        values: List[Optional[np.ndarray]] = [None] * len(self._nodes)
+        shared: Set[int] = set()  # slots whose arrays live in the cache
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            for i, node in enumerate(self._nodes):
+                cache_key = (node.key, np.dtype(dtype).str)
+                if cache is not None and node.op in _CACHEABLE_OPS:
+                    shared.add(i)
+                    cached = cache.get(cache_key)
+                    if cached is not None:
+                        values[i] = cached
+                        continue
+
+                args = [values[j] for j in self._arg_slots[i]]
+                values[i] = self._eval_node(node, args, i, prices, dtype, shared)
+                if i in shared:
+                    cache[cache_key] = values[i]
+                for j in self._arg_slots[i]:
+                    if self._last_use[j] == i:
+                        values[j] = None
+
+        results = []
+        for j in self._root_slots:
+            value = values[j]
+            if np.ndim(value) == 0:
+                value = np.full(len(prices), value)
+            results.append(value)
+        return results
+
+    def _eval_node(self, node: Expr, args: list, i: int, prices: pd.DataFrame, dtype, shared: Set[int]) -> np.ndarray:
+        """
+        Compute the value of node `i` from the values of its arguments.
+        """
+        op = node.op
+        if op == "column":
+            return prices[node.params[0]].to_numpy(dtype=dtype)
+        if op == "const":
+            return node.params[0]
+        if op in _BINARY_UFUNCS:
+            out = self._reusable_buffer(op, args, i, shared)
+            return _BINARY_UFUNCS[op](*args, out=out)
+        if op in _UNARY_UFUNCS:
+            out = self._reusable_buffer(op, args, i, shared)
+            return _UNARY_UFUNCS[op](*args, out=out)
+        x = np.asarray(args[0])
+        if x.ndim == 0:
+            x = np.full(len(prices), x)
+        if op == "shift":
+            return _shift(x, node.params[0])
+        if op == "sma":
+            return _rolling_mean(x.astype(dtype, copy=False), *node.params)
+        if op == "rsi":
+            return _rsi(x.astype(dtype, copy=False), node.params[0])
+        raise ValueError(f"Unknown expression op: {op}")
+
+    def _reusable_buffer(self, op: str, args: list, i: int, shared: Set[int]) -> Optional[np.ndarray]:
+        """
+        Pick an argument array that nothing reads after node `i` and whose
+        dtype and shape match the result, so the ufunc can write into it.
+        """
+        arrays = [a for a in args if np.ndim(a) > 0]
+        if not arrays:
+            return None
+        if op in _BOOL_OPS:
+            result_dtype = np.dtype(np.bool_)
+        else:
+            result_dtype = np.result_type(*args)
+        shape = np.broadcast_shapes(*(np.shape(a) for a in args))
+        for j, arg in zip(self._arg_slots[i], args):
+            if (
+                self._last_use[j] == i
+                and self._nodes[j].op not in ("column", "const")
+                and j not in shared
+                and arg.dtype == result_dtype
+                and arg.shape == shape
+            ):
+                return arg
+        return None
+
+
+def compile_expressions(*roots: Expr) -> CompiledExpressions:
+    """
+    Compile one or more expressions into a shared evaluation plan.
+
+    Parameters:
+    - *roots (Expr): Expressions to evaluate together
+
+    Returns:
+    - CompiledExpressions: Plan whose `evaluate(prices)` returns one array per root
+    """
+    return CompiledExpressions(*roots)
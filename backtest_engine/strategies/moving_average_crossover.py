@@ -9,8 +9,12 @@ and sells when it crosses below.
 @Created: 2025-06-17
 """
 
+import numpy as np
 import pandas as pd
+from backtest_engine.core.precision import DOUBLE, PrecisionPolicy
+from backtest_engine.core.signals import SparseSignals
 from backtest_engine.strategies.base_strategy import BaseStrategy
+from backtest_engine.strategies.expressions import close, compile_expressions, crossover, crossunder, sma
 
 
 class MovingAverageCrossoverStrategy(BaseStrategy):
@@ -22,7 +26,15 @@ class MovingAverageCrossoverStrategy(BaseStrategy):
     Hold: Otherwise
     """
 
-    def __init__(self, prices: pd.DataFrame, short_window: int = 20, long_window: int = 50) -> None:
+    shares_prices = True
+
+    def __init__(
+        self,
+        prices: pd.DataFrame,
+        short_window: int = 20,
+        long_window: int = 50,
+        precision: PrecisionPolicy = DOUBLE,
+    ) -> None:
         """
         Initialize strategy with price data and window lengths.
 
@@ -30,11 +42,34 @@ class MovingAverageCrossoverStrategy(BaseStrategy):
         - prices (pd.DataFrame): OHLCV price data with 'Close' column
         - short_window (int): Lookback for short-term moving average
         - long_window (int): Lookback for long-term moving average
+        - precision (PrecisionPolicy): Dtypes for prices, indicators and signals
         """
-        super().__init__(prices)
+        super().__init__(prices, precision)
         self.short_window = short_window
         self.long_window = long_window
 
+    @property
+    def warmup(self) -> int:
+        """
+        Long MA lookback (see Expr.lookback) plus the previous bar used to
+        dedupe signals.
+        """
+        return max(self.short_window, self.long_window) + 1
+
+    def _moving_averages(self):
+        """
+        Short and long MA expressions with min_periods=1.
+        """
+        return (sma(close, self.short_window, min_periods=1),
+                sma(close, self.long_window, min_periods=1))
+
+    def signal_expressions(self):
+        """
+        Crossover/crossunder expressions over the same MAs `generate_events` uses.
+        """
+        short_ma, long_ma = self._moving_averages()
+        return crossover(short_ma, long_ma), crossunder(short_ma, long_ma)
+
     def generate_signals(self) -> pd.Series:
         """
         Generate a Series of trading signals based on MA crossovers.
@@ -42,20 +77,33 @@ class MovingAverageCrossoverStrategy(BaseStrategy):
         Returns:
         - pd.Series of signals: 1 for buy, -1 for sell, 0 for hold
         """
-        short_ma = self.prices['Close'].rolling(window=self.short_window, min_periods=1).mean()
-        long_ma = self.prices['Close'].rolling(window=self.long_window, min_periods=1).mean()
+        return self.generate_events().to_dense(self.precision.signal_dtype)
+
+    def generate_events(self) -> SparseSignals:
+        """
+        Emit only the bars where the MA regime changes.
+
+        Returns:
+        - SparseSignals: 1 where short MA moves above long MA, -1 where it moves below
+        """
+        # The DSL kernel sums each window on its own, so MA values do not depend
+        # on where the history starts and resumed runs match full reruns exactly
+        short_values, long_values = compile_expressions(*self._moving_averages()).evaluate(
+            self.prices, dtype=self.precision.float_dtype
+        )
+        short_ma = pd.Series(short_values, index=self.prices.index, name="short_ma")
+        long_ma = pd.Series(long_values, index=self.prices.index, name="long_ma")
 
         self.indicators = {
             "short_ma": short_ma,
             "long_ma": long_ma
         }
 
-        signal = pd.Series(0, index=self.prices.index)
-
-        signal[short_ma > long_ma] = 1
-        signal[short_ma < long_ma] = -1
+        regime = (short_values > long_values).astype(np.int8) - (short_values < long_values)
 
-        # Avoid redundant signals (i.e., hold if signal hasn't changed)
-        signal = signal.where(signal != signal.shift(), 0)
+        # Avoid redundant signals (i.e., hold if regime hasn't changed)
+        changed = np.ones(len(regime), dtype=bool)
+        changed[1:] = regime[1:] != regime[:-1]
+        positions = np.flatnonzero(changed & (regime != 0))
 
-        return signal
+        return SparseSignals(self.prices.index, positions, regime[positions])
@@ -0,0 +1,111 @@
+"""
+@File: pairs_spread.py
+
+Pairs mean reversion on rolling hedge-ratio spreads.
+
+For each (y, x) pair the spread y - beta * x is computed with a rolling
+OLS hedge ratio. The strategy buys the spread when its z-score is
+stretched low, sells it when stretched high, and exits when it reverts.
+All pairs are processed together as columns of one array.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+from typing import List, Tuple
+import numpy as np
+import pandas as pd
+from backtest_engine.core.precision import DOUBLE, PrecisionPolicy
+from backtest_engine.strategies.cross_sectional import rolling_spread, rolling_zscore
+from backtest_engine.strategies.panel_strategy import PanelStrategy
+
+
+class PairsSpreadStrategy(PanelStrategy):
+    """
+    Pairs Spread Mean Reversion Strategy.
+
+    Long spread: z-score < -entry_z (long y, short beta * x)
+    Short spread: z-score > entry_z
+    Exit: |z-score| < exit_z
+    Hold: Otherwise
+    """
+
+    def __init__(
+        self,
+        prices: pd.DataFrame,
+        pairs: List[Tuple[str, str]],
+        window: int = 60,
+        entry_z: float = 2.0,
+        exit_z: float = 0.5,
+        precision: PrecisionPolicy = DOUBLE,
+    ) -> None:
+        """
+        Initialize strategy with a price panel and the pairs to trade.
+
+        Parameters:
+        - prices (pd.DataFrame): Close prices, one column per symbol
+        - pairs (list): (y, x) symbol pairs
+        - window (int): Lookback for the hedge ratio and spread z-score
+        - entry_z (float): |z-score| that opens a position
+        - exit_z (float): |z-score| below which a position is closed
+        - precision (PrecisionPolicy): Dtype for prices and weights
+        """
+        super().__init__(prices, precision)
+        if not pairs:
+            raise ValueError("At least one pair is required.")
+        missing = {s for pair in pairs for s in pair} - set(self.prices.columns)
+        if missing:
+            raise ValueError(f"Missing symbols in price panel: {missing}")
+        if exit_z >= entry_z:
+            raise ValueError("exit_z must be smaller than entry_z.")
+
+        self.pairs = list(pairs)
+        self.window = window
+        self.entry_z = entry_z
+        self.exit_z = exit_z
+
+    def spread_zscores(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Hedge ratios and spread z-scores, one column per pair.
+        """
+        y_cols = self.prices.columns.get_indexer([y for y, _ in self.pairs])
+        x_cols = self.prices.columns.get_indexer([x for _, x in self.pairs])
+        beta, spread = rolling_spread(self.values[:, y_cols], self.values[:, x_cols], self.window)
+        return beta, rolling_zscore(spread, self.window)
+
+    def positions(self, z: np.ndarray) -> np.ndarray:
+        """
+        Spread position per pair from its z-scores: 1 long, -1 short, 0 flat.
+        """
+        # Entry/exit events, carried forward until the next event
+        events = np.full(z.shape, np.nan)
+        events[np.abs(z) < self.exit_z] = 0
+        events[z > self.entry_z] = -1
+        events[z < -self.entry_z] = 1
+        events[0] = np.where(np.isnan(events[0]), 0, events[0])
+
+        last_event = np.where(~np.isnan(events), np.arange(len(z))[:, None], 0)
+        np.maximum.accumulate(last_event, axis=0, out=last_event)
+        return np.take_along_axis(events, last_event, axis=0)
+
+    def generate_weights(self) -> pd.DataFrame:
+        """
+        Translate spread positions into symbol weights, equal gross per pair.
+
+        Returns:
+        - pd.DataFrame: Target weights with total gross exposure up to 1
+        """
+        beta, z = self.spread_zscores()
+        position = self.positions(z)
+        beta = np.nan_to_num(beta)
+        gross = len(self.pairs) * (1 + np.abs(beta))
+
+        y_weight = position / gross
+        x_weight = -position * beta / gross
+
+        weights = np.zeros(self.values.shape)
+        y_cols = self.prices.columns.get_indexer([y for y, _ in self.pairs])
+        x_cols = self.prices.columns.get_indexer([x for _, x in self.pairs])
+        np.add.at(weights.T, y_cols, y_weight.T)
+        np.add.at(weights.T, x_cols, x_weight.T)
+        return self._weights_frame(weights)
@@ -0,0 +1,72 @@
+"""
+@File: panel_strategy.py
+
+Abstract base class for cross-sectional strategies over price panels.
+
+Where BaseStrategy sees one ticker's OHLCV frame, a PanelStrategy sees a
+(dates x symbols) panel of closing prices and returns target portfolio
+weights for every symbol on every date, which allows ranking, pairs and
+long-short basket strategies.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+from abc import ABC, abstractmethod
+import numpy as np
+import pandas as pd
+from backtest_engine.core.precision import DOUBLE, PrecisionPolicy
+
+
+class PanelStrategy(ABC):
+    """
+    Abstract base class for panel (multi-symbol) strategies.
+
+    Any subclass must implement `generate_weights`, returning target
+    weights with the same shape as the panel: positive for long, negative
+    for short, 0 for no position. Weights set on a date's close are held
+    until the next date's close.
+    """
+
+    def __init__(self, prices: pd.DataFrame, precision: PrecisionPolicy = DOUBLE) -> None:
+        """
+        Initialize the strategy with a close price panel.
+
+        Parameters:
+        - prices (pd.DataFrame): Closing prices indexed by date, one column per symbol;
+                                 NaN marks a missing bar
+        - precision (PrecisionPolicy): Dtype for prices and weights
+        """
+        self.precision = precision
+        self.prices = prices.astype(precision.float_dtype)
+        self._validate_prices()
+        self.values = self.prices.to_numpy()
+
+    @abstractmethod
+    def generate_weights(self) -> pd.DataFrame:
+        """
+        Generate target weights for every date and symbol.
+
+        Returns:
+        - pd.DataFrame: Weights aligned with the prices panel
+        """
+        pass
+
+    def _weights_frame(self, weights: np.ndarray) -> pd.DataFrame:
+        """
+        Wrap a weights array in a DataFrame aligned with the panel.
+        """
+        return pd.DataFrame(
+            weights.astype(self.precision.float_dtype, copy=False),
+            index=self.prices.index,
+            columns=self.prices.columns,
+        )
+
+    def _validate_prices(self) -> None:
+        """
+        Validate that the panel has symbols and a sorted, unique index.
+        """
+        if self.prices.shape[1] == 0:
+            raise ValueError("Price panel has no symbols.")
+        if not self.prices.index.is_monotonic_increasing or not self.prices.index.is_unique:
+            raise ValueError("Price panel index must be sorted and unique.")
@@ -9,32 +9,52 @@ Buy when RSI < 30, sell when RSI > 70
 """
 
 import pandas as pd
+from backtest_engine.core.precision import DOUBLE, PrecisionPolicy
 from backtest_engine.strategies.base_strategy import BaseStrategy
+from backtest_engine.strategies.expressions import close, compile_expressions, rsi
 
 
 class RSIMeanReversionStrategy(BaseStrategy):
-    def __init__(self, prices: pd.DataFrame, window: int = 14, low_threshold: float = 30, high_threshold: float = 70):
-        super().__init__(prices)
+    shares_prices = True
+    derived_attrs = ("_rsi",)
+
+    def __init__(self, prices: pd.DataFrame, window: int = 14, low_threshold: float = 30, high_threshold: float = 70,
+                 precision: PrecisionPolicy = DOUBLE):
+        super().__init__(prices, precision)
         self.window = window
         self.low_threshold = low_threshold
         self.high_threshold = high_threshold
-        self.rsi = self._compute_rsi()
-        self.indicators = {"RSI": self.rsi}
+        self._rsi = None
 
-    def _compute_rsi(self) -> pd.Series:
-        delta = self.prices["Close"].diff()
-        gain = delta.where(delta > 0, 0.0)
-        loss = -delta.where(delta < 0, 0.0)
+    @property
+    def rsi(self) -> pd.Series:
+        # Computed on first use so shared runners can skip it entirely
+        if self._rsi is None:
+            self._rsi = self._compute_rsi()
+        return self._rsi
+
+    @property
+    def indicators(self) -> dict:
+        return {"RSI": self.rsi}
 
-        avg_gain = gain.rolling(self.window).mean()
-        avg_loss = loss.rolling(self.window).mean()
+    @property
+    def warmup(self) -> int:
+        return self.window
+
+    def _compute_rsi(self) -> pd.Series:
+        # Same history-independent kernel as the expression form, so resumed
+        # and shared runs produce identical values
+        value, = compile_expressions(rsi(close, self.window)).evaluate(
+            self.prices, dtype=self.precision.float_dtype
+        )
+        return pd.Series(value, index=self.prices.index, name="RSI")
 
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+    def signal_expressions(self):
+        value = rsi(close, self.window)
+        return value < self.low_threshold, value > self.high_threshold
 
     def generate_signals(self) -> pd.Series:
-        signals = pd.Series(0, index=self.prices.index)
+        signals = self.precision.empty_signals(self.prices.index)
 
         signals[self.rsi < self.low_threshold] = 1  # BUY
         signals[self.rsi > self.high_threshold] = -1  # SELL
@@ -0,0 +1,46 @@
+"""
+@File: run_expression_strategy.py
+
+Run a backtest using a strategy built from signal expressions.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+from backtest_engine.data.loader import load_yahoo_data
+from backtest_engine.strategies.expressions import close, crossover, crossunder, rsi, sma
+from backtest_engine.strategies.expression_strategy import ExpressionStrategy
+from backtest_engine.core.backtester import Backtester
+from backtest_engine.metrics.evaluator import calculate_metrics
+from backtest_engine.visualization.plotter import plot_price_with_signals, plot_equity_curve
+
+
+def main():
+    ticker = "AAPL"
+    start_date = "2012-01-01"
+    end_date = "2023-01-01"
+
+    prices = load_yahoo_data(ticker, start=start_date, end=end_date)
+
+    fast, slow = sma(close, 20), sma(close, 50)
+    strategy = ExpressionStrategy(
+        prices,
+        buy=crossover(fast, slow) & (rsi(close, 14) < 70),
+        sell=crossunder(fast, slow),
+    )
+    signals = strategy.generate_signals()
+
+    backtester = Backtester(strategy, initial_cash=10000)
+    result_df = backtester.run()
+
+    metrics = calculate_metrics(result_df["portfolio_value"])
+    print(f"\nExpression Backtest Results for {ticker} ({start_date} to {end_date}):")
+    for k, v in metrics.items():
+        print(f"{k}: {v}")
+
+    plot_price_with_signals(prices, signals)
+    plot_equity_curve(result_df["portfolio_value"])
+
+
+if __name__ == "__main__":
+    main()
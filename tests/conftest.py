@@ -1,5 +1,99 @@
+"""
+@File: conftest.py
+
+Shared fixtures: synthetic price histories and the strategies run over them.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
 import sys
 import os
 
 # Add the root directory to sys.path so backtest_engine is importable
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import pandas as pd
+import pytest
+from backtest_engine.core.precision import DOUBLE
+from backtest_engine.strategies.expression_strategy import ExpressionStrategy
+from backtest_engine.strategies.expressions import close, crossover, crossunder, rsi, sma
+from backtest_engine.strategies.moving_average_crossover import MovingAverageCrossoverStrategy
+from backtest_engine.strategies.rsi_mean_reversion import RSIMeanReversionStrategy
+
+
+def _random_walk(n: int = 500, seed: int = 0, start: str = "2020-01-01", freq: str = "D") -> pd.DataFrame:
+    """
+    Geometric random walk of closes rounded to cents, with volumes.
+    """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Close": np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.02, n))), 2),
+        "Volume": rng.integers(1000, 5000, n),
+    }, index=pd.date_range(start, periods=n, freq=freq))
+
+
+def _tick_walk(n: int = 3000, seed: int = 4, start: str = "2015-01-01", freq: str = "D") -> pd.DataFrame:
+    """
+    Prices moving in 0.10 ticks with flat stretches, where MAs tie often.
+    """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Close": np.round(100 + np.cumsum(rng.choice([-0.1, 0.0, 0.0, 0.1], n)), 2),
+        "Volume": rng.integers(1000, 5000, n),
+    }, index=pd.date_range(start, periods=n, freq=freq))
+
+
+_WALKS = {"random_walk": _random_walk, "tick_walk": _tick_walk}
+
+_FACTORIES = {
+    "mac": lambda p, precision=DOUBLE: MovingAverageCrossoverStrategy(p, 5, 20, precision=precision),
+    "rsi": lambda p, precision=DOUBLE: RSIMeanReversionStrategy(p, window=14, precision=precision),
+    "expr": lambda p, precision=DOUBLE: ExpressionStrategy(
+        p,
+        buy=crossover(sma(close, 5), sma(close, 20)) & (rsi(close, 10) < 60),
+        sell=crossunder(sma(close, 5), sma(close, 20)),
+        precision=precision,
+    ),
+}
+
+
+@pytest.fixture
+def random_walk():
+    """
+    Builder for random-walk prices: random_walk(n=500, seed=0, start=..., freq="D").
+    """
+    return _random_walk
+
+
+@pytest.fixture
+def tick_walk():
+    """
+    Builder for tick-quantized prices: tick_walk(n=3000, seed=4, start=..., freq="D").
+    """
+    return _tick_walk
+
+
+@pytest.fixture(params=sorted(_WALKS))
+def walk(request):
+    """
+    Each price builder in turn, for tests that must hold on smooth and tied prices.
+    """
+    return _WALKS[request.param]
+
+
+@pytest.fixture
+def strategy_factories() -> dict:
+    """
+    Name -> factory(prices, precision=DOUBLE) for the built-in strategy kinds.
+    """
+    return dict(_FACTORIES)
+
+
+@pytest.fixture(params=sorted(_FACTORIES))
+def strategy_factory(request):
+    """
+    Each built-in strategy factory in turn, called as factory(prices, precision=DOUBLE).
+    """
+    return _FACTORIES[request.param]
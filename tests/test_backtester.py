@@ -8,6 +8,7 @@ Unit tests for the Backtester core engine.
 """
 
 import pandas as pd
+import pytest
 from backtest_engine.core.backtester import Backtester
 from backtest_engine.strategies.base_strategy import BaseStrategy
 
@@ -52,3 +53,18 @@ def test_backtester_executes_trades_correctly():
     final_value = result["portfolio_value"].iloc[-1]
     expected_cash = 1000 / 105 * 120
     assert abs(final_value - expected_cash) < 1e-6
+
+
+def test_backtester_rejects_signals_off_the_price_index():
+    """
+    A signal dated outside the price data must raise, not trade at another bar's close.
+    """
+    class FutureSignalStrategy(BaseStrategy):
+        def generate_signals(self) -> pd.Series:
+            index = self.prices.index.append(pd.DatetimeIndex(["2030-01-01"]))
+            return pd.Series([0, 1, 0, 0, 0, -1], index=index)
+
+    prices = pd.DataFrame({'Close': [100, 105, 110, 120, 115]}, index=pd.date_range("2024-01-01", periods=5))
+
+    with pytest.raises(KeyError, match="2030-01-01"):
+        Backtester(FutureSignalStrategy(prices)).run()
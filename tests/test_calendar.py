@@ -0,0 +1,84 @@
+"""
+@File: test_calendar.py
+
+Unit tests for the trading calendar and up-front series alignment.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from backtest_engine.data.calendar import MissingBarsWarning, TradingCalendar, report_incomplete_rows
+from backtest_engine.strategies.cross_sectional_momentum import CrossSectionalMomentumStrategy
+
+
+def _frames():
+    days = pd.date_range("2024-01-01", periods=6, freq="B")
+    us = pd.DataFrame({"Close": [1.0, 2.0, 3.0, 4.0, 5.0], "Volume": [10, 20, 30, 40, 50]}, index=days.delete(2))
+    eu = pd.DataFrame({"Close": [7.0, 8.0, 9.0, 10.0, 11.0], "Volume": [1, 2, 3, 4, 5]}, index=days.delete(4))
+    return days, {"US": us, "EU": eu}
+
+
+def test_calendar_maps_timestamps_to_dense_positions():
+    days, frames = _frames()
+    calendar = TradingCalendar.from_frames(frames)
+
+    assert len(calendar) == 6
+    pd.testing.assert_index_equal(calendar.sessions, days.rename("date"), check_exact=True, exact=False)
+    assert calendar.position(days[3]) == 3
+    assert calendar.positions([days[5], pd.Timestamp("2030-01-01"), days[0]]).tolist() == [5, -1, 0]
+    with pytest.raises(KeyError):
+        calendar.position(pd.Timestamp("2030-01-01"))
+
+
+def test_align_reports_missing_and_extra_bars():
+    """
+    Gaps become NaN rows and off-calendar bars are reported, not silently dropped.
+    """
+    days, frames = _frames()
+    calendar = TradingCalendar(days[:5])
+    aligned, report = calendar.align(frames["US"], "US")
+
+    assert aligned.index.equals(calendar.sessions)
+    assert np.isnan(aligned["Close"].iloc[2])
+    assert aligned["Close"].iloc[3] == 3.0
+    assert report.missing["US"].tolist() == [days[2]]
+    assert report.extra["US"].tolist() == [days[5]]
+    assert not report.is_clean
+    assert "US: 1 missing bars" in report.summary()
+
+
+def test_align_panel_builds_contiguous_symbol_columns():
+    days, frames = _frames()
+    calendar = TradingCalendar.from_frames(frames)
+    panel, report = calendar.align_panel(frames)
+
+    assert list(panel.columns) == ["US", "EU"]
+    assert panel.shape == (6, 2)
+    assert report.missing == {"US": pd.DatetimeIndex([days[2]], name="date"),
+                              "EU": pd.DatetimeIndex([days[4]], name="date")}
+
+    with pytest.warns(MissingBarsWarning, match="EU: 1 missing bars"):
+        report.warn()
+
+    # Aligned panels feed straight into panel strategies
+    weights = CrossSectionalMomentumStrategy(panel, lookback=1, top_k=1, rebalance=1).generate_weights()
+    assert weights.shape == panel.shape
+
+
+def test_integer_columns_stay_integral_when_complete():
+    days, frames = _frames()
+    aligned, report = TradingCalendar(frames["US"].index).align(frames["US"], "US")
+
+    assert report.is_clean
+    assert aligned["Volume"].dtype == np.int64
+
+
+def test_incomplete_rows_are_reported():
+    index = pd.date_range("2024-01-01", periods=4)
+    frame = pd.DataFrame({"Close": [1.0, np.nan, 3.0, 4.0]}, index=index)
+
+    with pytest.warns(MissingBarsWarning, match="AAPL: 1 missing bars"):
+        report_incomplete_rows(frame, "AAPL").warn()
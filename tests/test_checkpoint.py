@@ -0,0 +1,127 @@
+"""
+@File: test_checkpoint.py
+
+Unit tests for checkpointing a backtest and resuming it over new bars.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import pandas as pd
+import pytest
+from backtest_engine.core.backtester import Backtester
+from backtest_engine.core.checkpoint import BacktestCheckpoint
+from backtest_engine.strategies.base_strategy import BaseStrategy
+from backtest_engine.strategies.moving_average_crossover import MovingAverageCrossoverStrategy
+from backtest_engine.strategies.rsi_mean_reversion import RSIMeanReversionStrategy
+
+
+def test_resume_matches_full_run(strategy_factory, walk, tmp_path):
+    """
+    Resuming from a saved checkpoint over appended bars should reproduce a full rerun.
+    """
+    factory = strategy_factory
+    prices = walk(400)
+
+    full = Backtester(factory(prices), initial_cash=1000.0)
+    full_result = full.run()
+
+    split = 300
+    first = Backtester(factory(prices.iloc[:split]), initial_cash=1000.0)
+    first.run()
+    path = tmp_path / "state.json"
+    first.checkpoint().save(path)
+
+    resumed = Backtester.resume(BacktestCheckpoint.load(path), factory, prices.iloc[split:])
+    result = resumed.run()
+
+    pd.testing.assert_frame_equal(result, full_result.iloc[split:], check_exact=True)
+    assert len(resumed.prices) == factory(prices).warmup + len(prices) - split
+
+    expected_trades = [t for t in full.trade_log if t.date > prices.index[split - 1]]
+    assert resumed.trade_log == expected_trades
+    assert first.trade_log + resumed.trade_log == full.trade_log
+
+
+@pytest.mark.parametrize("factory", [
+    lambda p: MovingAverageCrossoverStrategy(p, short_window=3, long_window=7),
+    lambda p: RSIMeanReversionStrategy(p, window=5),
+])
+def test_resume_is_exact_on_tick_quantized_prices(factory, tick_walk):
+    """
+    Indicator values must not depend on where the history starts, or near-ties
+    on flat stretches flip signals after a resume.
+    """
+    prices = tick_walk()
+    full = Backtester(factory(prices), initial_cash=1000.0)
+    full_result = full.run()
+
+    for split in range(2, len(prices), 97):
+        first = Backtester(factory(prices.iloc[:split]), initial_cash=1000.0)
+        first.run()
+        resumed = Backtester.resume(first.checkpoint(), factory, prices.iloc[split:])
+
+        pd.testing.assert_frame_equal(resumed.run(), full_result.iloc[split:], check_exact=True)
+        assert first.trade_log + resumed.trade_log == full.trade_log
+
+
+def test_checkpoint_roundtrip_is_exact(random_walk):
+    """
+    Serialized checkpoints should restore floats and the history frame exactly.
+    """
+    prices = random_walk(60)
+    backtester = Backtester(MovingAverageCrossoverStrategy(prices, 3, 7), initial_cash=1234.5)
+    backtester.run()
+
+    checkpoint = backtester.checkpoint()
+    restored = BacktestCheckpoint.from_dict(checkpoint.to_dict())
+
+    assert restored.cash == checkpoint.cash
+    assert restored.position == checkpoint.position
+    assert restored.entry_price == checkpoint.entry_price
+    assert restored.last_date == prices.index[-1]
+    assert len(restored.history) == 8
+    pd.testing.assert_frame_equal(restored.history, checkpoint.history, check_freq=False)
+
+
+def test_tz_aware_checkpoint_roundtrip_across_dst(random_walk, strategy_factories, tmp_path):
+    """
+    Intraday history spanning a DST change should load with its named timezone
+    and resume into a tz-aware index, not fixed offsets or object dtype.
+    """
+    index = pd.date_range("2024-03-08 09:30", periods=400, freq="h", tz="America/New_York")
+    prices = random_walk(400).set_axis(index)
+    factory = strategy_factories["mac"]
+
+    full_result = Backtester(factory(prices), initial_cash=1000.0).run()
+
+    split = 50  # warm-up history straddles the 2024-03-10 clock change
+    first = Backtester(factory(prices.iloc[:split]), initial_cash=1000.0)
+    first.run()
+    path = tmp_path / "state.json"
+    first.checkpoint().save(path)
+    restored = BacktestCheckpoint.load(path)
+
+    assert str(restored.history.index.tz) == "America/New_York"
+    assert restored.last_date == prices.index[split - 1]
+    assert str(restored.last_date.tz) == "America/New_York"
+    pd.testing.assert_frame_equal(restored.history, first.checkpoint().history, check_freq=False)
+
+    resumed = Backtester.resume(restored, factory, prices.iloc[split:])
+    assert isinstance(resumed.prices.index, pd.DatetimeIndex)
+    pd.testing.assert_frame_equal(resumed.run(), full_result.iloc[split:], check_exact=True)
+
+
+def test_checkpoint_requires_declared_warmup(random_walk):
+    """
+    Strategies without a warmup may depend on all history and cannot be checkpointed.
+    """
+    class DummyStrategy(BaseStrategy):
+        def generate_signals(self) -> pd.Series:
+            return pd.Series(0, index=self.prices.index)
+
+    backtester = Backtester(DummyStrategy(random_walk(10)))
+    backtester.run()
+
+    with pytest.raises(ValueError, match="warmup"):
+        backtester.checkpoint()
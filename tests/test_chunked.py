@@ -0,0 +1,86 @@
+"""
+@File: test_chunked.py
+
+Unit tests for out-of-core, chunk-by-chunk backtesting.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import pandas as pd
+import pytest
+from backtest_engine.core.backtester import Backtester
+from backtest_engine.core.chunked import ChunkedBacktester, read_csv_chunks
+from backtest_engine.strategies.base_strategy import BaseStrategy
+from backtest_engine.strategies.moving_average_crossover import MovingAverageCrossoverStrategy
+
+
+@pytest.mark.parametrize("chunksize", [7, 64, 1000])
+def test_chunked_run_matches_in_memory_run(strategy_factory, walk, chunksize, tmp_path):
+    """
+    Streaming prices from disk in chunks, even ones shorter than the warm-up,
+    should reproduce the in-memory equity curve and trades exactly.
+    """
+    prices_path = tmp_path / "prices.csv"
+    walk(500, freq="min").to_csv(prices_path)
+    prices = pd.read_csv(prices_path, index_col=0, parse_dates=True, float_precision="round_trip")
+
+    full = Backtester(strategy_factory(prices), initial_cash=1000.0)
+    expected = full.run()
+
+    chunked = ChunkedBacktester(strategy_factory, initial_cash=1000.0)
+    equity_path, trades_path = tmp_path / "equity.csv", tmp_path / "trades.csv"
+    final = chunked.run(read_csv_chunks(prices_path, chunksize), equity_path, trades_path)
+
+    equity = pd.read_csv(equity_path, index_col=0, parse_dates=True, float_precision="round_trip")
+    pd.testing.assert_frame_equal(equity, expected, check_freq=False, check_exact=True)
+
+    trades = pd.read_csv(trades_path, parse_dates=["date"], float_precision="round_trip")
+    assert chunked.trade_count == len(full.trade_log) == len(trades)
+    assert trades["date"].tolist() == [t.date for t in full.trade_log]
+    assert trades["type"].tolist() == [t.type for t in full.trade_log]
+    assert trades["price"].tolist() == [t.price for t in full.trade_log]
+
+    assert chunked.bars_processed == len(prices)
+    assert final.cash == full.portfolio.cash
+    assert final.position == full.portfolio.position
+    assert len(final.history) <= strategy_factory(prices).warmup
+
+
+@pytest.mark.parametrize("chunksize", [50, 250])
+def test_chunked_run_is_exact_on_tick_quantized_prices(chunksize, tick_walk, tmp_path):
+    """
+    Near-tie MA crossovers on flat stretches must not flip at chunk boundaries.
+    """
+    prices = tick_walk()
+    factory = lambda p: MovingAverageCrossoverStrategy(p, short_window=3, long_window=7)
+
+    full = Backtester(factory(prices), initial_cash=1000.0)
+    expected = full.run()
+
+    chunked = ChunkedBacktester(factory, initial_cash=1000.0)
+    chunks = (prices.iloc[i:i + chunksize] for i in range(0, len(prices), chunksize))
+    final = chunked.run(chunks, tmp_path / "equity.csv")
+
+    equity = pd.read_csv(tmp_path / "equity.csv", index_col=0, parse_dates=True, float_precision="round_trip")
+    pd.testing.assert_frame_equal(equity, expected, check_freq=False, check_exact=True)
+    assert chunked.trade_count == len(full.trade_log)
+    assert final.cash == full.portfolio.cash
+    assert final.position == full.portfolio.position
+
+
+def test_chunks_must_be_time_ordered(random_walk, strategy_factories):
+    prices = random_walk(100)
+    chunked = ChunkedBacktester(strategy_factories["mac"])
+
+    with pytest.raises(ValueError, match="overlaps"):
+        chunked.run([prices.iloc[:60], prices.iloc[50:]])
+
+
+def test_strategies_without_warmup_are_rejected(random_walk):
+    class DummyStrategy(BaseStrategy):
+        def generate_signals(self) -> pd.Series:
+            return pd.Series(0, index=self.prices.index)
+
+    with pytest.raises(ValueError, match="warmup"):
+        ChunkedBacktester(DummyStrategy).run([random_walk(20)])
@@ -0,0 +1,130 @@
+"""
+@File: test_expressions.py
+
+Unit tests for the signal expression DSL and ExpressionStrategy.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from backtest_engine.core.backtester import Backtester
+from backtest_engine.strategies.expression_strategy import ExpressionStrategy
+from backtest_engine.strategies.expressions import (
+    close, compile_expressions, crossover, crossunder, rsi, sma, volume
+)
+from backtest_engine.strategies.moving_average_crossover import MovingAverageCrossoverStrategy
+from backtest_engine.strategies.rsi_mean_reversion import RSIMeanReversionStrategy
+
+
+def test_indicators_match_pandas(random_walk):
+    """
+    sma and rsi kernels should agree with the pandas implementations.
+    """
+    prices = random_walk()
+    sma_values, rsi_values = compile_expressions(sma(close, 10), rsi(close, 14)).evaluate(prices)
+
+    expected_sma = prices["Close"].rolling(10, min_periods=1).mean().to_numpy()
+    delta = prices["Close"].diff()
+    avg_gain = delta.where(delta > 0, 0.0).rolling(14).mean()
+    avg_loss = (-delta.where(delta < 0, 0.0)).rolling(14).mean()
+    expected_rsi = (100 - 100 / (1 + avg_gain / avg_loss)).to_numpy()
+
+    np.testing.assert_allclose(sma_values, expected_sma, rtol=1e-12)
+    np.testing.assert_allclose(rsi_values, expected_rsi, rtol=1e-9, equal_nan=True)
+
+
+@pytest.mark.parametrize("window", [1, 2, 3, 7, 8, 13, 64, 200, 500])
+def test_rolling_mean_is_history_independent(window, random_walk):
+    """
+    Beyond its lookback, an sma value must not depend on where the data starts,
+    and it must agree with pandas, NaNs included.
+    """
+    prices = random_walk(400)
+    prices.iloc[[5, 50, 51], 0] = np.nan
+    program = compile_expressions(sma(close, window))
+    full, = program.evaluate(prices)
+
+    expected = prices["Close"].rolling(window, min_periods=1).mean().to_numpy()
+    np.testing.assert_allclose(full, expected, rtol=1e-12, equal_nan=True)
+
+    lookback = sma(close, window).lookback
+    for start in range(0, len(prices) - lookback, 37):
+        tail, = program.evaluate(prices.iloc[start:])
+        np.testing.assert_array_equal(tail[lookback:], full[start + lookback:])
+
+
+def test_moving_averages_tie_exactly_before_the_short_window_fills(random_walk):
+    """
+    Until the short window is full both MAs average the same bars and must be equal.
+    """
+    prices = random_walk(100)
+    short, long_ = compile_expressions(sma(close, 10), sma(close, 30)).evaluate(prices, dtype=np.float32)
+    np.testing.assert_array_equal(short[:10], long_[:10])
+
+
+def test_common_subexpressions_are_shared():
+    """
+    Identical subexpressions built separately should compile to a single node.
+    """
+    fast, slow = sma(close, 3), sma(close, 5)
+    program = compile_expressions(crossover(fast, slow), crossunder(sma(close, 3), sma(close, 5)))
+
+    # close, sma3, sma5, and for each direction: cmp, shift, not, and
+    assert program.node_count == 3 + 2 * 4
+    assert program.columns == {"Close"}
+
+
+def test_crossover_strategy_matches_moving_average_crossover():
+    """
+    ExpressionStrategy should reproduce MovingAverageCrossoverStrategy signals.
+    """
+    prices = pd.DataFrame({
+        'Close': [10, 10, 10, 10, 10, 12, 14, 16, 18, 20, 19, 17, 15, 13, 11]
+    }, index=pd.date_range("2024-01-01", periods=15))
+
+    fast, slow = sma(close, 3), sma(close, 5)
+    strategy = ExpressionStrategy(prices, buy=crossover(fast, slow), sell=crossunder(fast, slow))
+    expected = MovingAverageCrossoverStrategy(prices, 3, 5).generate_signals()
+
+    pd.testing.assert_series_equal(strategy.generate_signals(), expected)
+
+
+def test_expression_strategy_runs_in_backtester(random_walk):
+    """
+    A compiled expression strategy should plug into the Backtester directly.
+    """
+    prices = random_walk()
+    strategy = ExpressionStrategy(prices, buy=rsi(close, 14) < 30, sell=rsi(close, 14) > 70)
+    result = Backtester(strategy, initial_cash=1000).run()
+
+    expected = Backtester(RSIMeanReversionStrategy(prices), initial_cash=1000).run()
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_intermediate_buffers_do_not_touch_prices(random_walk):
+    """
+    In-place buffer reuse must never write into the caller's price data.
+    """
+    prices = random_walk(50)
+    original = prices.copy()
+    compile_expressions((close * 2 + 1) / close - close).evaluate(prices)
+
+    pd.testing.assert_frame_equal(prices, original)
+
+
+def test_invalid_expressions_raise(random_walk):
+    """
+    Using Python boolean operators or non-boolean signals should fail loudly.
+    """
+    with pytest.raises(TypeError):
+        (close > 1) and (close < 2)
+
+    prices = random_walk(20)[["Close"]]
+    with pytest.raises(TypeError, match="booleans"):
+        ExpressionStrategy(prices, buy=sma(close, 3)).generate_signals()
+
+    with pytest.raises(ValueError, match="Missing required columns"):
+        ExpressionStrategy(prices, buy=volume > 0)
@@ -0,0 +1,199 @@
+"""
+@File: test_memo.py
+
+Unit tests for content-addressed memoization of backtest results.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import os
+import pickle
+import numpy as np
+import pandas as pd
+import pytest
+from backtest_engine.core.backtester import Backtester
+from backtest_engine.core.memo import CachedBacktester, ResultCache, content_hash
+from backtest_engine.core.precision import COMPACT
+from backtest_engine.strategies.expression_strategy import ExpressionStrategy
+from backtest_engine.strategies.expressions import close, crossover, crossunder, sma
+from backtest_engine.strategies.moving_average_crossover import MovingAverageCrossoverStrategy
+from backtest_engine.strategies.rsi_mean_reversion import RSIMeanReversionStrategy
+
+
+def test_identical_inputs_hash_identically(random_walk):
+    prices = random_walk()
+    a = MovingAverageCrossoverStrategy(prices, short_window=5, long_window=20)
+    b = MovingAverageCrossoverStrategy(prices.copy(), short_window=5, long_window=20)
+    assert content_hash(a, 1000.0) == content_hash(b, 1000.0)
+
+
+def test_any_input_change_changes_the_hash(random_walk):
+    prices = random_walk()
+    base = content_hash(MovingAverageCrossoverStrategy(prices, 5, 20), 1000.0)
+
+    bumped = prices.copy()
+    bumped.iloc[150, 0] += 0.01
+    variants = [
+        content_hash(MovingAverageCrossoverStrategy(bumped, 5, 20), 1000.0),
+        content_hash(MovingAverageCrossoverStrategy(prices, 5, 21), 1000.0),
+        content_hash(MovingAverageCrossoverStrategy(prices, 5, 20), 1001.0),
+        content_hash(MovingAverageCrossoverStrategy(prices, 5, 20, precision=COMPACT), 1000.0),
+        content_hash(ExpressionStrategy(prices, crossover(sma(close, 5), sma(close, 20))), 1000.0),
+    ]
+    assert len({base, *variants}) == len(variants) + 1
+
+
+def test_private_parameters_are_part_of_the_hash(random_walk):
+    """
+    Parameters stored under underscore names must still invalidate the cache.
+    """
+    class ThresholdStrategy(MovingAverageCrossoverStrategy):
+        def __init__(self, prices, threshold):
+            super().__init__(prices, 5, 20)
+            self._threshold = threshold
+
+    prices = random_walk()
+    assert content_hash(ThresholdStrategy(prices, 1.0), 1000.0) != content_hash(ThresholdStrategy(prices, 2.0), 1000.0)
+
+
+def test_derived_state_does_not_change_the_hash(random_walk):
+    strategy = RSIMeanReversionStrategy(random_walk(), window=10)
+    before = content_hash(strategy, 1000.0)
+    strategy.generate_signals()  # computes and stores the RSI series
+    assert content_hash(strategy, 1000.0) == before
+
+
+def test_subclasses_declare_their_own_derived_state(random_walk):
+    """
+    Derived attributes declared by a subclass are skipped along with its parents'.
+    """
+    class CachedSignalsStrategy(RSIMeanReversionStrategy):
+        derived_attrs = ("_signals",)
+
+        def __init__(self, prices, window):
+            super().__init__(prices, window)
+            self._signals = None
+
+        def generate_signals(self):
+            if self._signals is None:
+                self._signals = super().generate_signals()
+            return self._signals
+
+    strategy = CachedSignalsStrategy(random_walk(), window=10)
+    before = content_hash(strategy, 1000.0)
+    strategy.generate_signals()
+    assert strategy._signals is not None and strategy._rsi is not None
+    assert content_hash(strategy, 1000.0) == before
+
+
+def test_unreadable_entries_are_misses(tmp_path):
+    """
+    Truncated files and pickles of moved modules or classes are cache misses.
+    """
+    cache = ResultCache(str(tmp_path))
+    payload = pickle.dumps(ResultCache)
+    moved_module = payload.replace(b"backtest_engine.core.memo", b"nonexistent_pkg.core.memo")
+    moved_class = payload.replace(b"ResultCache", b"MissingName")
+    (tmp_path / "truncated.pkl").write_bytes(payload[:5])
+    (tmp_path / "moved_module.pkl").write_bytes(moved_module)
+    (tmp_path / "moved_class.pkl").write_bytes(moved_class)
+
+    with pytest.raises(ModuleNotFoundError):
+        pickle.loads(moved_module)
+    with pytest.raises(AttributeError):
+        pickle.loads(moved_class)
+    for key in ("missing", "truncated", "moved_module", "moved_class"):
+        assert cache.get(key) is None
+
+
+def test_cached_run_returns_stored_result_and_trades(random_walk, tmp_path):
+    prices = random_walk()
+    cache = ResultCache(str(tmp_path))
+    make = lambda: ExpressionStrategy(
+        prices, buy=crossover(sma(close, 5), sma(close, 20)), sell=crossunder(sma(close, 5), sma(close, 20))
+    )
+
+    first = CachedBacktester(make(), 1000.0, cache)
+    result = first.run()
+    assert not first.cache_hit
+
+    second = CachedBacktester(make(), 1000.0, cache)
+    cached = second.run()
+    assert second.cache_hit
+    pd.testing.assert_frame_equal(cached, result)
+    assert second.trade_log == first.trade_log
+    assert second.portfolio.cash == first.portfolio.cash
+    assert second.checkpoint().to_dict() == first.checkpoint().to_dict()
+
+    reference = Backtester(make(), 1000.0)
+    pd.testing.assert_frame_equal(reference.run(), cached)
+
+    changed = CachedBacktester(make(), 2000.0, cache)
+    changed.run()
+    assert not changed.cache_hit
+
+
+def test_unhashable_parameters_bypass_the_cache(random_walk, tmp_path):
+    cache = ResultCache(str(tmp_path))
+    strategy = MovingAverageCrossoverStrategy(random_walk(), 5, 20)
+    strategy.callback = object()
+
+    for _ in range(2):
+        backtester = CachedBacktester(strategy, 1000.0, cache)
+        backtester.run()
+        assert not backtester.cache_hit
+    assert not os.listdir(tmp_path)
+
+
+def test_store_evicts_least_recently_used_entries(tmp_path):
+    payload = np.zeros(1000)
+    cache = ResultCache(str(tmp_path), max_bytes=int(2.5 * payload.nbytes))
+
+    cache.put("a", payload)
+    cache.put("b", payload)
+    os.utime(tmp_path / "a.pkl", (1, 1))
+    os.utime(tmp_path / "b.pkl", (2, 2))
+    assert cache.get("a") is not None  # touching "a" makes "b" the oldest
+
+    cache.put("c", payload)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_eviction_tolerates_entries_removed_concurrently(tmp_path, monkeypatch):
+    """
+    Another process evicting the same entries must not fail this one's put.
+    """
+    cache = ResultCache(str(tmp_path), max_bytes=0)
+    cache.put("a", np.zeros(10))
+    real_remove = os.remove
+
+    def remove_twice(path):
+        real_remove(path)  # the other process got there first
+        real_remove(path)
+
+    monkeypatch.setattr(os, "remove", remove_twice)
+    cache.put("b", np.zeros(10))
+    assert not os.listdir(tmp_path)
+
+
+def test_failed_put_leaves_no_temp_file_and_does_not_fail_the_run(random_walk, tmp_path):
+    class Unpicklable:
+        def __reduce__(self):
+            raise pickle.PicklingError("not today")
+
+    cache = ResultCache(str(tmp_path))
+    with pytest.raises(pickle.PicklingError):
+        cache.put("bad", Unpicklable())
+    assert not os.listdir(tmp_path)
+
+    class FailingCache(ResultCache):
+        def put(self, key, value):
+            raise OSError("disk full")
+
+    strategy = MovingAverageCrossoverStrategy(random_walk(), 5, 20)
+    backtester = CachedBacktester(strategy, 1000.0, FailingCache(str(tmp_path)))
+    with pytest.warns(RuntimeWarning, match="disk full"):
+        result = backtester.run()
+    pd.testing.assert_frame_equal(result, Backtester(strategy, 1000.0).run())
@@ -0,0 +1,181 @@
+"""
+@File: test_multi_runner.py
+
+Unit tests for running many strategies over the same data in one pass.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from backtest_engine.core.backtester import Backtester
+from backtest_engine.core.multi_runner import MultiStrategyRunner
+from backtest_engine.strategies.base_strategy import BaseStrategy
+from backtest_engine.strategies.moving_average_crossover import MovingAverageCrossoverStrategy
+from backtest_engine.strategies.rsi_mean_reversion import RSIMeanReversionStrategy
+
+
+class EveryTenthBarStrategy(BaseStrategy):
+    """
+    Alternates buy and sell every ten bars; has no expression form.
+    """
+    def generate_signals(self) -> pd.Series:
+        signals = pd.Series(0, index=self.prices.index)
+        signals.iloc[::20] = 1
+        signals.iloc[10::20] = -1
+        return signals
+
+
+@pytest.fixture
+def factories(strategy_factories):
+    """
+    The built-in strategies plus a second MAC and one with no expression form.
+    """
+    return {
+        **strategy_factories,
+        "mac_slow": lambda p: MovingAverageCrossoverStrategy(p, 10, 40),
+        "custom": EveryTenthBarStrategy,
+    }
+
+
+def test_runner_matches_individual_backtests(random_walk, factories):
+    """
+    Each strategy's equity curve and trade log should equal its own Backtester run.
+    """
+    prices = random_walk()
+    runner = MultiStrategyRunner(prices, factories, initial_cash=1000.0)
+    result = runner.run()
+
+    assert list(result.columns) == list(factories)
+    for name, factory in factories.items():
+        backtester = Backtester(factory(prices), initial_cash=1000.0)
+        expected = backtester.run()
+
+        np.testing.assert_array_equal(result[name].to_numpy(), expected["portfolio_value"].to_numpy())
+        pd.testing.assert_index_equal(result.index, expected.index)
+        assert runner.trade_logs[name] == backtester.trade_log
+
+
+def test_runner_shares_indicator_computation(random_walk, factories):
+    """
+    Strategies with expression forms should not compute their own indicators.
+    """
+    runner = MultiStrategyRunner(random_walk(), factories)
+    runner.run()
+
+    assert runner.strategies["rsi"]._rsi is None
+    assert not hasattr(runner.strategies["mac"], "indicators")
+
+
+def test_runner_signals_match_strategy_signals(random_walk, factories):
+    """
+    Shared-plan signals should equal each strategy's own generate_signals.
+    """
+    prices = random_walk()
+    runner = MultiStrategyRunner(prices, factories)
+    signals = runner.generate_signals()
+
+    for name, factory in factories.items():
+        np.testing.assert_array_equal(signals[name].to_numpy(), factory(prices).generate_signals().to_numpy())
+
+
+def test_runner_and_strategies_agree_at_near_ties(tick_walk):
+    """
+    On tick-quantized prices MAs tie often; the shared plan and each strategy's
+    own signals must still agree exactly, and so must the equity curves.
+    """
+    factories = {
+        "mac": lambda p: MovingAverageCrossoverStrategy(p, 3, 7),
+        "rsi": lambda p: RSIMeanReversionStrategy(p, window=5),
+    }
+    for seed in range(40):
+        prices = tick_walk(400, seed=seed)
+
+        runner = MultiStrategyRunner(prices, factories, initial_cash=1000.0)
+        signals = runner.generate_signals()
+        result = runner.run()
+        for name, factory in factories.items():
+            strategy = factory(prices)
+            np.testing.assert_array_equal(signals[name].to_numpy(), strategy.generate_signals().to_numpy())
+            expected = Backtester(strategy, initial_cash=1000.0).run()
+            np.testing.assert_array_equal(result[name].to_numpy(), expected["portfolio_value"].to_numpy())
+
+
+def test_subclass_overriding_signals_is_not_run_from_inherited_expressions(random_walk, factories):
+    """
+    A subclass changing its events must trade its own signals, not the
+    expressions it inherits.
+    """
+    class LateStartStrategy(MovingAverageCrossoverStrategy):
+        def generate_events(self):
+            events = super().generate_events()
+            keep = events.positions >= 300
+            return type(events)(events.index, events.positions[keep], events.actions[keep])
+
+    prices = random_walk()
+    pair = {"late": lambda p: LateStartStrategy(p, 5, 20), "mac": factories["mac"]}
+    runner = MultiStrategyRunner(prices, pair, initial_cash=1000.0)
+    result = runner.run()
+
+    for name, factory in pair.items():
+        expected = Backtester(factory(prices), initial_cash=1000.0).run()
+        np.testing.assert_array_equal(result[name].to_numpy(), expected["portfolio_value"].to_numpy())
+    assert not runner.generate_signals()["late"].iloc[:300].any()
+    assert runner.generate_signals()["mac"].iloc[:300].any()
+
+
+def test_runner_strategies_share_one_price_frame(random_walk, factories):
+    prices = random_walk()
+    runner = MultiStrategyRunner(prices, factories)
+
+    assert runner.prices is not prices
+    assert all(runner.strategies[name].prices is runner.prices for name in ("mac", "mac_slow", "rsi", "expr"))
+    assert runner.strategies["custom"].prices is not runner.prices
+    assert factories["mac"](runner.prices).prices is not runner.prices
+
+
+def test_strategies_modifying_prices_do_not_affect_their_neighbours(random_walk, factories):
+    """
+    Subclasses that have not opted in to sharing get their own copy to modify.
+    """
+    class ReturnsStrategy(MovingAverageCrossoverStrategy):
+        def __init__(self, prices):
+            super().__init__(prices, 5, 20)
+            self.prices["Close"] = self.prices["Close"].pct_change().fillna(0.0)
+
+    prices = random_walk()
+    runner = MultiStrategyRunner(prices, {"returns": ReturnsStrategy, "mac": factories["mac"]}, initial_cash=1000.0)
+
+    assert list(runner.prices.columns) == list(prices.columns)
+    np.testing.assert_array_equal(runner.prices["Close"].to_numpy(), prices["Close"].to_numpy())
+    assert runner.strategies["mac"].prices is runner.prices
+    expected = Backtester(factories["mac"](prices), initial_cash=1000.0).run()
+    np.testing.assert_array_equal(runner.run()["mac"].to_numpy(), expected["portfolio_value"].to_numpy())
+
+
+def test_runner_rejects_signals_off_the_price_index(random_walk, factories):
+    """
+    An event dated outside the price data must raise, not trade on the last bar.
+    """
+    class FutureSignalStrategy(BaseStrategy):
+        def generate_signals(self) -> pd.Series:
+            index = self.prices.index.append(pd.DatetimeIndex(["2030-01-01"]))
+            signals = pd.Series(0, index=index)
+            signals.iloc[[10, -1]] = [1, -1]
+            return signals
+
+    runner = MultiStrategyRunner(random_walk(), {"future": FutureSignalStrategy, "mac": factories["mac"]})
+    with pytest.raises(KeyError, match="2030-01-01"):
+        runner.run()
+
+
+def test_runner_requires_close_and_strategies(random_walk, factories):
+    """
+    Invalid inputs should be rejected up front.
+    """
+    with pytest.raises(ValueError, match="Missing required columns"):
+        MultiStrategyRunner(pd.DataFrame({"Open": [1.0, 2.0]}), factories)
+    with pytest.raises(ValueError, match="At least one strategy"):
+        MultiStrategyRunner(random_walk(), {})
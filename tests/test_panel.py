@@ -0,0 +1,196 @@
+"""
+@File: test_panel.py
+
+Unit tests for cross-sectional primitives, panel strategies and the PanelBacktester.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from backtest_engine.core.panel_backtester import PanelBacktester
+from backtest_engine.metrics.evaluator import calculate_metrics
+from backtest_engine.strategies.cross_sectional import (
+    bottom_k, rank, rolling_spread, rolling_zscore, top_k, zscore
+)
+from backtest_engine.strategies.cross_sectional_momentum import CrossSectionalMomentumStrategy
+from backtest_engine.strategies.pairs_spread import PairsSpreadStrategy
+
+
+def _panel(n_dates: int = 300, n_symbols: int = 40, seed: int = 5) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    drift = np.linspace(-0.002, 0.002, n_symbols)
+    log_prices = np.cumsum(rng.normal(drift, 0.01, (n_dates, n_symbols)), axis=0)
+    return pd.DataFrame(
+        100 * np.exp(log_prices),
+        index=pd.date_range("2020-01-01", periods=n_dates, freq="B"),
+        columns=[f"S{i:03d}" for i in range(n_symbols)],
+    )
+
+
+def test_rank_and_zscore_match_pandas():
+    """
+    Row-wise rank and z-score should agree with pandas, NaNs included.
+    """
+    panel = _panel(50, 12)
+    panel.iloc[3, 4] = np.nan
+    panel.iloc[10, :6] = np.nan
+
+    expected_rank = panel.rank(axis=1, method="first", pct=True).to_numpy()
+    np.testing.assert_allclose(rank(panel.to_numpy()), expected_rank, equal_nan=True)
+
+    centered = panel.sub(panel.mean(axis=1), axis=0)
+    expected_z = centered.div(panel.std(axis=1, ddof=0), axis=0).to_numpy()
+    np.testing.assert_allclose(zscore(panel.to_numpy()), expected_z, equal_nan=True)
+
+
+def test_top_and_bottom_k_select_extremes():
+    x = np.array([
+        [5.0, 1.0, 3.0, np.nan, 4.0],
+        [np.nan, np.nan, 2.0, np.nan, 1.0],
+    ])
+    assert top_k(x, 2).tolist() == [
+        [True, False, False, False, True],
+        [False, False, True, False, True],
+    ]
+    assert bottom_k(x, 1).tolist() == [
+        [False, True, False, False, False],
+        [False, False, False, False, True],
+    ]
+
+
+def test_rolling_spread_matches_pandas_regression():
+    """
+    Rolling hedge ratios should equal pandas rolling cov / var.
+    """
+    panel = _panel(120, 2)
+    y, x = panel.iloc[:, 0], panel.iloc[:, 1]
+    beta, spread = rolling_spread(y.to_numpy()[:, None], x.to_numpy()[:, None], 30)
+
+    expected_beta = (y.rolling(30).cov(x) / x.rolling(30).var()).to_numpy()
+    np.testing.assert_allclose(beta[:, 0], expected_beta, rtol=1e-6, equal_nan=True)
+    np.testing.assert_allclose(spread[:, 0], y.to_numpy() - expected_beta * x.to_numpy(), rtol=1e-6, equal_nan=True)
+
+    s = pd.Series(spread[:, 0])
+    expected_z = ((s - s.rolling(30).mean()) / s.rolling(30).std(ddof=0)).to_numpy()
+    np.testing.assert_allclose(rolling_zscore(spread, 30)[:, 0], expected_z, rtol=1e-5, atol=1e-8, equal_nan=True)
+
+
+def test_momentum_strategy_holds_strongest_symbols():
+    """
+    With trending symbols, the long book should favour the strongest drifts.
+    """
+    panel = _panel()
+    strategy = CrossSectionalMomentumStrategy(panel, lookback=60, top_k=5, rebalance=20)
+    weights = strategy.generate_weights()
+
+    assert weights.shape == panel.shape
+    assert (weights.iloc[:60] == 0).all().all()
+    np.testing.assert_allclose(weights.iloc[60:].sum(axis=1), 1.0)
+
+    last_rebalance = 60 + 20 * ((len(panel) - 1 - 60) // 20)
+    momentum = panel.iloc[last_rebalance] / panel.iloc[last_rebalance - 60] - 1
+    held = set(weights.columns[weights.iloc[-1] > 0])
+    assert held == set(momentum.nlargest(5).index)
+
+    result = PanelBacktester(strategy, initial_cash=1000.0).run()
+    assert result["portfolio_value"].iloc[-1] > 1000.0
+    assert "CAGR" in calculate_metrics(result["portfolio_value"])
+
+
+def test_long_short_momentum_is_dollar_neutral():
+    panel = _panel()
+    weights = CrossSectionalMomentumStrategy(panel, 60, 5, 20, long_short=True).generate_weights()
+    active = weights.iloc[60:]
+
+    np.testing.assert_allclose(active.sum(axis=1), 0.0, atol=1e-12)
+    np.testing.assert_allclose(active.abs().sum(axis=1), 1.0)
+
+
+def test_pairs_strategy_trades_mean_reverting_spread():
+    """
+    A cointegrated pair should be traded against its spread, with bounded gross exposure.
+    """
+    rng = np.random.default_rng(9)
+    n = 400
+    x = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    noise = np.zeros(n)
+    for t in range(1, n):
+        noise[t] = 0.8 * noise[t - 1] + rng.normal(0, 1)
+    y = 1.5 * x + noise
+    panel = pd.DataFrame({"Y": y, "X": x, "Z": x[::-1]}, index=pd.date_range("2021-01-01", periods=n))
+
+    strategy = PairsSpreadStrategy(panel, pairs=[("Y", "X")], window=40, entry_z=1.5, exit_z=0.25)
+    weights = strategy.generate_weights()
+
+    assert (weights["Z"] == 0).all()
+    assert (np.sign(weights["Y"]) == -np.sign(weights["X"])).all()
+    assert weights.abs().sum(axis=1).max() <= 1.0 + 1e-12
+    assert (weights["Y"] > 0).any() and (weights["Y"] < 0).any()
+
+    _, z = strategy.spread_zscores()
+    position = np.sign(weights["Y"].to_numpy())
+    assert (position[z[:, 0] < -1.5] == 1).all()
+    assert (position[z[:, 0] > 1.5] == -1).all()
+    assert (position[np.abs(z[:, 0]) < 0.25] == 0).all()
+
+
+def test_panel_backtester_applies_previous_weights_to_returns():
+    """
+    Each day's return should be the prior day's weights times that day's symbol returns.
+    """
+    panel = pd.DataFrame({
+        "A": [100.0, 110.0, 99.0, 99.0],
+        "B": [50.0, 50.0, 55.0, np.nan],
+    }, index=pd.date_range("2024-01-01", periods=4))
+
+    class FixedWeights(CrossSectionalMomentumStrategy):
+        def generate_weights(self) -> pd.DataFrame:
+            return self._weights_frame(np.array([[1.0, 0.0], [0.5, -0.5], [0.0, 1.0], [0.0, 0.0]]))
+
+    result = PanelBacktester(FixedWeights(panel), initial_cash=1000.0).run()
+    expected_returns = [0.0, 0.10, 0.5 * -0.1 - 0.5 * 0.1, 0.0]
+
+    np.testing.assert_allclose(result["returns"], expected_returns)
+    np.testing.assert_allclose(result["portfolio_value"], 1000.0 * np.cumprod(1 + np.array(expected_returns)))
+
+
+def test_panel_backtester_earns_the_move_across_missing_bars():
+    """
+    A position held across a NaN gap should earn the full move once prices resume.
+    """
+    panel = pd.DataFrame({
+        "A": [100.0, np.nan, 120.0, 120.0],
+        "B": [np.nan, 50.0, 55.0, 55.0],
+    }, index=pd.date_range("2024-01-01", periods=4))
+
+    class FixedWeights(CrossSectionalMomentumStrategy):
+        def generate_weights(self) -> pd.DataFrame:
+            return self._weights_frame(np.array([[1.0, 0.0], [1.0, 0.0], [0.0, 1.0], [0.0, 0.0]]))
+
+    result = PanelBacktester(FixedWeights(panel), initial_cash=1000.0).run()
+
+    np.testing.assert_allclose(result["returns"], [0.0, 0.0, 0.2, 0.0])
+    assert result["portfolio_value"].iloc[-1] == pytest.approx(1200.0)
+
+
+def test_pairs_strategy_validates_inputs():
+    panel = _panel(50, 3)
+    with pytest.raises(ValueError, match="Missing symbols"):
+        PairsSpreadStrategy(panel, pairs=[("S000", "NOPE")])
+    with pytest.raises(ValueError, match="exit_z"):
+        PairsSpreadStrategy(panel, pairs=[("S000", "S001")], entry_z=1.0, exit_z=1.0)
+
+
+def test_momentum_scales_to_thousands_of_symbols():
+    """
+    3,000 symbols over a year of daily bars should run as plain array operations.
+    """
+    panel = _panel(260, 3000)
+    strategy = CrossSectionalMomentumStrategy(panel, lookback=60, top_k=100, rebalance=5, long_short=True)
+    result = PanelBacktester(strategy).run()
+
+    assert len(result) == 260
+    assert np.isfinite(result["portfolio_value"]).all()
@@ -0,0 +1,71 @@
+"""
+@File: test_precision.py
+
+Compare COMPACT precision results against the float64 DOUBLE baseline.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import numpy as np
+import pytest
+from backtest_engine.core.backtester import Backtester
+from backtest_engine.core.precision import COMPACT, COMPACT_TOLERANCES, DOUBLE
+from backtest_engine.metrics.evaluator import calculate_metrics
+from backtest_engine.strategies.moving_average_crossover import MovingAverageCrossoverStrategy
+from backtest_engine.strategies.rsi_mean_reversion import RSIMeanReversionStrategy
+
+
+def test_compact_policy_dtypes(random_walk):
+    """
+    COMPACT should store prices as float32 and signals as int8, leaving Volume alone.
+    """
+    strategy = MovingAverageCrossoverStrategy(random_walk(100), 5, 20, precision=COMPACT)
+    signals = strategy.generate_signals()
+
+    assert strategy.prices["Close"].dtype == np.float32
+    assert strategy.prices["Volume"].dtype == np.int64
+    assert signals.dtype == np.int8
+    assert strategy.indicators["long_ma"].dtype == np.float32
+
+    result = Backtester(strategy).run()
+    assert result["portfolio_value"].dtype == np.float32
+    assert result.index.dtype == np.int64
+    assert result.index[0] == strategy.prices.index[0].value
+
+
+def test_compact_matches_double_within_tolerance(strategy_factory, random_walk):
+    """
+    Signals, equity and metrics under COMPACT should match DOUBLE within the documented tolerances.
+    """
+    prices = random_walk(1000)
+    double = strategy_factory(prices, DOUBLE)
+    compact = strategy_factory(prices, COMPACT)
+
+    np.testing.assert_array_equal(compact.generate_signals(), double.generate_signals())
+
+    double_result = Backtester(double, initial_cash=1000.0).run()
+    compact_result = Backtester(compact, initial_cash=1000.0).run()
+    np.testing.assert_allclose(
+        compact_result["portfolio_value"].to_numpy(),
+        double_result["portfolio_value"].to_numpy(),
+        rtol=COMPACT_TOLERANCES["equity_rtol"],
+    )
+
+    double_metrics = calculate_metrics(double_result["portfolio_value"])
+    compact_metrics = calculate_metrics(compact_result["portfolio_value"])
+    for key in ("CAGR", "Sharpe Ratio", "Max Drawdown"):
+        assert compact_metrics[key] == pytest.approx(
+            double_metrics[key], abs=COMPACT_TOLERANCES["metric_atol"], nan_ok=True
+        )
+
+
+def test_compact_indicators_within_tolerance(random_walk):
+    """
+    float32 indicators should stay within the documented relative tolerance.
+    """
+    prices = random_walk(1000)
+    double = RSIMeanReversionStrategy(prices, window=14).rsi.to_numpy()
+    compact = RSIMeanReversionStrategy(prices, window=14, precision=COMPACT).rsi.to_numpy()
+
+    np.testing.assert_allclose(compact, double, rtol=COMPACT_TOLERANCES["indicator_rtol"], equal_nan=True)
@@ -0,0 +1,189 @@
+"""
+@File: test_service.py
+
+Tests for the local backtest service, run entirely on localhost.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import json
+import urllib.error
+import urllib.request
+import numpy as np
+import pandas as pd
+import pytest
+from backtest_engine.core.backtester import Backtester
+from backtest_engine.service.cache import MemoryLRUCache
+from backtest_engine.service.server import (
+    BacktestJob, BacktestServer, BacktestService, _fingerprint, request_backtest
+)
+from backtest_engine.strategies.moving_average_crossover import MovingAverageCrossoverStrategy
+from backtest_engine.strategies.rsi_mean_reversion import RSIMeanReversionStrategy
+
+
+class SyntheticLoader:
+    """
+    Deterministic stand-in for load_yahoo_data that counts downloads.
+    """
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, ticker: str, start: str, end: str) -> pd.DataFrame:
+        self.calls += 1
+        index = pd.date_range(start, end, freq="B")
+        rng = np.random.default_rng(sum(map(ord, ticker)))
+        closes = np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.02, len(index)))), 2)
+        return pd.DataFrame({"Close": closes}, index=index)
+
+
+MAC_JOB = dict(strategy="MovingAverageCrossoverStrategy", ticker="AAPL",
+               start="2020-01-01", end="2021-12-31", params={"short_window": 5, "long_window": 20})
+RSI_JOB = dict(strategy="RSIMeanReversionStrategy", ticker="AAPL",
+               start="2020-01-01", end="2021-12-31", params={"window": 14})
+
+
+@pytest.fixture
+def service():
+    loader = SyntheticLoader()
+    service = BacktestService(loader=loader, max_workers=2, batch_window=0.05)
+    yield service
+    service.close()
+
+
+def test_batched_jobs_share_one_load_and_match_backtester(service):
+    """
+    Concurrent jobs on the same dataset should be batched and match Backtester results.
+    """
+    futures = [service.submit(BacktestJob(**MAC_JOB)), service.submit(BacktestJob(**RSI_JOB))]
+    results = [f.result(timeout=10) for f in futures]
+
+    assert service.loader.calls == 1
+    assert service.stats["batches"] == 1
+
+    prices = service.loader("AAPL", "2020-01-01", "2021-12-31")
+    for result, strategy in zip(results, [
+        MovingAverageCrossoverStrategy(prices, 5, 20),
+        RSIMeanReversionStrategy(prices, window=14),
+    ]):
+        expected = Backtester(strategy).run()["portfolio_value"]
+        assert [v for _, v in result["equity"]] == expected.tolist()
+        assert result["metrics"]["Final Value"] == round(expected.iloc[-1], 2)
+
+
+def test_warm_cache_skips_reload_and_indicator_work(service):
+    """
+    A repeated job should reuse cached prices and indicators.
+    """
+    first = service.run(BacktestJob(**MAC_JOB), timeout=10)
+    hits_before = service.cache.hits
+    second = service.run(BacktestJob(**MAC_JOB), timeout=10)
+
+    assert service.loader.calls == 1
+    assert service.cache.hits - hits_before >= 3  # prices + two moving averages
+    assert first == second
+
+
+def test_invalid_jobs_are_rejected(service):
+    with pytest.raises(ValueError, match="Unknown strategy"):
+        service.submit(BacktestJob(**dict(MAC_JOB, strategy="Nope")))
+    with pytest.raises(ValueError, match="Invalid parameters"):
+        service.submit(BacktestJob(**dict(MAC_JOB, params={"bogus": 1})))
+
+
+def test_bad_job_fails_alone_within_its_batch(service):
+    """
+    A job that fails validation should not fail the jobs batched with it.
+    """
+    good = service.submit(BacktestJob(**MAC_JOB))
+    bad = service.submit(BacktestJob(**dict(RSI_JOB, params={"window": 0})))
+
+    assert good.result(timeout=10)["equity"]
+    with pytest.raises(ValueError, match="window"):
+        bad.result(timeout=10)
+    assert service.stats["batches"] == 1
+
+
+def test_submit_after_close_raises(service):
+    service.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        service.submit(BacktestJob(**MAC_JOB))
+
+
+def test_reloaded_prices_do_not_reuse_stale_indicators(service):
+    """
+    Indicators are scoped by price content, not by ticker and date range.
+    """
+    service.run(BacktestJob(**MAC_JOB), timeout=10)
+
+    # Simulate eviction and a re-download that returns different rows
+    prices = service.loader("AAPL", "2020-01-01", "2021-12-31")
+    prices["Close"] = prices["Close"].to_numpy()[::-1]
+    service.cache[("prices", "AAPL", "2020-01-01", "2021-12-31")] = (prices, _fingerprint(prices))
+
+    result = service.run(BacktestJob(**MAC_JOB), timeout=10)
+    expected = Backtester(MovingAverageCrossoverStrategy(prices, 5, 20)).run()["portfolio_value"]
+    assert [v for _, v in result["equity"]] == expected.tolist()
+
+
+def test_http_endpoint_on_localhost(service):
+    """
+    Jobs posted over HTTP should return JSON results, including batches.
+    """
+    server = BacktestServer(service).start()
+    try:
+        single = request_backtest(server.url, MAC_JOB)
+        batch = request_backtest(server.url, [MAC_JOB, RSI_JOB])
+
+        assert single == batch[0]
+        assert len(batch[1]["equity"]) == len(single["equity"])
+
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            request_backtest(server.url, dict(MAC_JOB, strategy="Nope"))
+        assert excinfo.value.code == 400
+        assert "Unknown strategy" in json.loads(excinfo.value.read())["error"]
+    finally:
+        server.httpd.shutdown()
+        server.httpd.server_close()
+
+
+def test_undefined_metrics_are_sent_as_null(service):
+    """
+    A job that never trades has no Sharpe ratio; the response must still be strict JSON.
+    """
+    def reject_constant(name):
+        raise ValueError(f"Non-standard JSON constant {name}")
+
+    server = BacktestServer(service).start()
+    try:
+        job = dict(RSI_JOB, params={"window": 14, "low_threshold": 0, "high_threshold": 100})
+        request = urllib.request.Request(
+            f"{server.url}/backtest", data=json.dumps(job).encode(), headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=10) as response:
+            result = json.loads(response.read(), parse_constant=reject_constant)
+
+        assert result["trades"] == []
+        assert result["metrics"]["Sharpe Ratio"] is None
+        assert result["metrics"]["CAGR"] == 0.0
+    finally:
+        server.httpd.shutdown()
+        server.httpd.server_close()
+
+
+def test_memory_lru_cache_evicts_least_recently_used():
+    """
+    Entries beyond the byte cap should be evicted oldest-first.
+    """
+    cache = MemoryLRUCache(max_bytes=3 * 800)
+    for key in "abc":
+        cache[key] = np.zeros(100)  # 800 bytes each
+    cache.get("a")
+    cache["d"] = np.zeros(100)
+
+    assert "b" not in cache
+    assert all(key in cache for key in "acd")
+    assert cache.current_bytes == 3 * 800
+
+    cache["huge"] = np.zeros(1000)
+    assert "huge" not in cache
@@ -0,0 +1,100 @@
+"""
+@File: test_signals.py
+
+Unit tests for sparse change-point signals and event-driven equity construction.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from backtest_engine.core.backtester import Backtester
+from backtest_engine.core.portfolio import Portfolio
+from backtest_engine.core.signals import SparseSignals
+from backtest_engine.strategies.base_strategy import BaseStrategy
+from backtest_engine.strategies.moving_average_crossover import MovingAverageCrossoverStrategy
+from backtest_engine.strategies.rsi_mean_reversion import RSIMeanReversionStrategy
+
+
+def _per_bar_equity(prices: pd.DataFrame, signals: pd.Series, initial_cash: float) -> np.ndarray:
+    """
+    Reference implementation: walk every bar and value the portfolio each day.
+    """
+    portfolio = Portfolio(initial_cash)
+    values = []
+    for date, signal in signals.items():
+        price = float(prices.loc[date, "Close"])
+        if signal == 1:
+            portfolio.buy(price)
+        elif signal == -1:
+            portfolio.sell(price)
+        values.append(portfolio.value(price))
+    return np.array(values)
+
+
+def test_sparse_dense_roundtrip():
+    """
+    Collapsing and expanding a dense signal Series should be lossless.
+    """
+    index = pd.date_range("2024-01-01", periods=6)
+    dense = pd.Series([0, 1, 0, 0, -1, 0], index=index)
+    sparse = SparseSignals.from_dense(dense)
+
+    assert sparse.positions.tolist() == [1, 4]
+    assert sparse.actions.tolist() == [1, -1]
+    assert sparse.actions.dtype == np.int8
+    pd.testing.assert_series_equal(sparse.to_dense(), dense)
+
+
+def test_mac_events_match_dense_signals(random_walk):
+    """
+    MovingAverageCrossoverStrategy events should be exactly the non-hold dense signals.
+    """
+    strategy = MovingAverageCrossoverStrategy(random_walk(), 5, 20)
+    events = strategy.generate_events()
+    dense = strategy.generate_signals()
+
+    np.testing.assert_array_equal(events.positions, np.flatnonzero(dense.to_numpy()))
+    np.testing.assert_array_equal(events.actions, dense.to_numpy()[events.positions])
+
+
+@pytest.mark.parametrize("factory", [
+    lambda p: MovingAverageCrossoverStrategy(p, 5, 20),
+    lambda p: RSIMeanReversionStrategy(p, window=14),
+])
+def test_event_driven_equity_matches_per_bar_walk(factory, random_walk):
+    """
+    Equity built from event bars only should equal valuing the portfolio every bar.
+    """
+    prices = random_walk()
+    strategy = factory(prices)
+    result = Backtester(strategy, initial_cash=1000.0).run()
+
+    expected = _per_bar_equity(prices, strategy.generate_signals(), 1000.0)
+    np.testing.assert_array_equal(result["portfolio_value"].to_numpy(), expected)
+
+
+def test_strategy_can_emit_events_directly():
+    """
+    A strategy overriding generate_events should run without a dense signal Series.
+    """
+    class TwoTradeStrategy(BaseStrategy):
+        def generate_events(self) -> SparseSignals:
+            return SparseSignals(self.prices.index, [10, 90_000], [1, -1])
+
+        def generate_signals(self) -> pd.Series:
+            return self.generate_events().to_dense()
+
+    n = 100_000
+    # Minute bars keep 100k timestamps well inside the datetime64[ns] range
+    index = pd.date_range("1990-01-01", periods=n, freq="min")
+    prices = pd.DataFrame({"Close": np.linspace(100, 200, n)}, index=index)
+    backtester = Backtester(TwoTradeStrategy(prices), initial_cash=1000.0)
+    result = backtester.run()
+
+    assert len(result) == n
+    assert [t.type for t in backtester.trade_log] == ["BUY", "SELL"]
+    assert result["portfolio_value"].iloc[0] == 1000.0
+    assert result["portfolio_value"].iloc[-1] == pytest.approx(1000.0 / prices["Close"].iloc[10] * prices["Close"].iloc[90_000])
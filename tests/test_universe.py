@@ -0,0 +1,75 @@
+"""
+@File: test_universe.py
+
+Unit tests for the local data store and parallel universe backtests.
+
+@Author: Tarek Fakhri
+@Date: 2026-10-19
+"""
+
+import pandas as pd
+import pytest
+from backtest_engine.core.backtester import Backtester
+from backtest_engine.core.universe import UniverseRunner
+from backtest_engine.data.store import LocalDataStore
+from backtest_engine.metrics.evaluator import calculate_metrics
+from backtest_engine.strategies.rsi_mean_reversion import RSIMeanReversionStrategy
+
+
+@pytest.fixture
+def store(tmp_path, random_walk):
+    store = LocalDataStore(str(tmp_path / "prices"))
+    for k in range(12):
+        store.save(f"S{k:02d}", random_walk(300, seed=k))
+    store.save("BROKEN", pd.DataFrame({"Open": [1.0, 2.0]}, index=pd.date_range("2020-01-01", periods=2)))
+    return store
+
+
+def test_store_round_trips_frames(random_walk, tmp_path):
+    store = LocalDataStore(str(tmp_path))
+    prices = random_walk(300)
+    store.save("BTC-USD", prices)
+
+    assert "BTC-USD" in store and "ETH-USD" not in store
+    assert store.symbols() == ["BTC-USD"]
+    pd.testing.assert_frame_equal(store.load("BTC-USD"), prices)
+    with pytest.raises(KeyError):
+        store.load("ETH-USD")
+
+
+def test_store_populate_isolates_download_failures(random_walk, tmp_path):
+    def loader(ticker, start, end):
+        if ticker == "BAD":
+            raise ValueError("No data returned")
+        return random_walk(300, seed=1)
+
+    store = LocalDataStore(str(tmp_path))
+    failures = store.populate(["GOOD", "BAD"], "2020-01-01", "2021-01-01", loader=loader)
+
+    assert store.symbols() == ["GOOD"]
+    assert failures == {"BAD": "ValueError: No data returned"}
+
+
+def test_universe_ranks_metrics_and_isolates_failures(store):
+    runner = UniverseRunner(store, RSIMeanReversionStrategy, {"window": 10}, initial_cash=1000.0, max_workers=1)
+    result = runner.run(store.symbols() + ["MISSING"])
+
+    assert len(result.table) == 12
+    assert set(result.failures) == {"BROKEN", "MISSING"}
+    assert "KeyError" in result.failures["MISSING"]
+    assert result.table["Sharpe Ratio"].is_monotonic_decreasing
+    assert result.symbols_per_second > 0
+    assert "12 symbols ok, 2 failed" in result.summary()
+
+    backtester = Backtester(RSIMeanReversionStrategy(store.load("S03"), window=10), 1000.0)
+    expected = calculate_metrics(backtester.run()["portfolio_value"])
+    assert result.table.loc["S03", "CAGR"] == expected["CAGR"]
+    assert result.table.loc["S03", "Trades"] == len(backtester.trade_log)
+
+
+def test_process_pool_matches_serial_run(store):
+    serial = UniverseRunner(store, RSIMeanReversionStrategy, max_workers=1).run()
+    parallel = UniverseRunner(store, RSIMeanReversionStrategy, max_workers=2).run()
+
+    pd.testing.assert_frame_equal(parallel.table, serial.table)
+    assert parallel.failures == serial.failures